@@ -2,6 +2,12 @@ import os
 import sys
 
 
+def _is_utf8(stream) -> bool:
+    """Check whether a text stream already encodes UTF-8."""
+    encoding = getattr(stream, "encoding", None) or ""
+    return encoding.lower().replace("-", "").replace("_", "") == "utf8"
+
+
 def setup_encoding():
     """Configure UTF-8 encoding for the application."""
     # Set environment variables for Python encoding
@@ -9,6 +15,10 @@ def setup_encoding():
     os.environ.setdefault("LC_ALL", "C.UTF-8")
     os.environ.setdefault("LANG", "C.UTF-8")
 
+    # Streams that already encode UTF-8 need no reconfiguration (and its flush)
+    if all(_is_utf8(stream) for stream in (sys.stdout, sys.stderr)):
+        return
+
     # Force stdout/stderr to use UTF-8 encoding
     if hasattr(sys.stdout, "reconfigure"):
         sys.stdout.reconfigure(encoding="utf-8", errors="replace")
@@ -8,18 +8,19 @@ Users can opt-out in several ways:
 3. Create opt-out file: touch ~/.bugster_no_analytics
 """
 
+import atexit
 import functools
 import logging
 import os
+import threading
 import time
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 from typing import Optional
 
 import typer
 
-from bugster.libs.settings import libs_settings
-from bugster.utils.file import load_config
 from bugster.utils.user_config import get_api_key, extract_organization_id
 logger = logging.getLogger(__name__)
 
@@ -27,14 +28,38 @@ logger = logging.getLogger(__name__)
 OPT_OUT_ENV_VAR = "BUGSTER_ANALYTICS_DISABLED"
 OPT_OUT_FILE = Path.home() / ".bugster_no_analytics"
 
+# Maximum time the CLI waits for queued events to be delivered on exit
+FLUSH_TIMEOUT_SECONDS = 1.0
+
+
+@functools.lru_cache(maxsize=1)
+def _opt_out_state() -> Optional[str]:
+    """Return how the user opted out of analytics (`"env"` or `"file"`), if they did."""
+    if os.getenv(OPT_OUT_ENV_VAR, "").lower() in ("true", "1", "yes"):
+        return "env"
+
+    if OPT_OUT_FILE.exists():
+        return "file"
+
+    return None
+
 
 class PostHogClient:
     """Minimal PostHog client for tracking specific business events."""
 
     def __init__(self):
+        from bugster.libs.settings import libs_settings
+
         self.api_key = libs_settings.posthog_api_key
         self.host = libs_settings.posthog_host
         self.environment = libs_settings.environment.value
+        is_github_app = os.getenv("IS_GITHUB_APP") == "true"
+        self._base_properties = MappingProxyType(
+            {
+                "environment": self.environment,
+                "source": "github_cli" if is_github_app else "cli",
+            }
+        )
 
         if not self.api_key or "disabled" in self.api_key:
             logger.warning(
@@ -48,130 +73,117 @@ class PostHogClient:
 
                 posthog.api_key = self.api_key
                 posthog.host = self.host
-                posthog.sync_mode = True  # Ensure events are sent before CLI exits
                 posthog.debug = libs_settings.debug
                 self._client = posthog
-                logger.debug(f"PostHog configured for {self.environment} environment")
+                logger.debug("PostHog configured for %s environment", self.environment)
             except ImportError:
                 logger.debug("PostHog not available, analytics disabled")
                 self.enabled = False
             except Exception as e:
-                logger.debug(f"Failed to setup PostHog: {e}")
+                logger.debug("Failed to setup PostHog: %s", e)
                 self.enabled = False
 
     def _should_disable_analytics(self) -> bool:
         """Check if analytics should be disabled based on user preferences."""
-        # Check environment variable
-        if os.getenv(OPT_OUT_ENV_VAR, "").lower() in ("true", "1", "yes"):
+        from bugster.libs.settings import libs_settings
+
+        # Check environment variable and opt-out file
+        opt_out = _opt_out_state()
+
+        if opt_out == "env":
             logger.debug("Analytics disabled via environment variable")
             return True
 
-        # Check opt-out file
-        if OPT_OUT_FILE.exists():
+        if opt_out == "file":
             logger.debug("Analytics disabled via opt-out file")
             return True
 
         # Check if PostHog is disabled
         if not libs_settings.posthog_enabled:
-            logger.debug(f"Analytics disabled for environment: {self.environment}")
+            logger.debug("Analytics disabled for environment: %s", self.environment)
             return True
 
         return False
 
-    def _track_event(self, event_name: str, user_id: str, properties: dict) -> None:
+    def _track_event(
+        self, event_name: str, user_id: str, properties: Optional[dict] = None
+    ) -> None:
         """Internal method to track events with consistent properties."""
         if not self.enabled or self._should_disable_analytics():
             return
 
         try:
-            is_github_app = os.getenv("IS_GITHUB_APP") == "true"
-            source = "github_cli" if is_github_app else "cli"
-
-            # Add base properties to all events
-            base_properties = {
-                "environment": self.environment,
-                "timestamp": datetime.utcnow().isoformat(),
-                "source": source,
-            }
+            # Build the event properties in a single dict: base properties first,
+            # then the event-specific ones so they can override them
+            final_properties = dict(
+                self._base_properties, timestamp=datetime.utcnow().isoformat()
+            )
 
-            # Merge with event-specific properties
-            final_properties = {**base_properties, **properties}
+            if properties:
+                final_properties.update(properties)
 
             # Track the event
             self._client.capture(
                 distinct_id=user_id, event=event_name, properties=final_properties
             )
 
-            logger.info(f"PostHog event tracked: {event_name} for user {user_id}")
+            logger.info("PostHog event tracked: %s for user %s", event_name, user_id)
 
         except Exception as e:
-            logger.error(f"Error tracking PostHog event '{event_name}': {e}")
+            logger.error("Error tracking PostHog event '%s': %s", event_name, e)
 
-    def track_cli_generate(
-        self, organization_id: str, project_id: Optional[str]
+    def _track_cli_event(
+        self, event_name: str, organization_id: str, project_id: Optional[str]
     ) -> None:
-        """Track CLI generate event."""
-        properties = {
-            "organization_id": organization_id,
-        }
+        """Track a CLI command event for an organization and optional project."""
+        properties = {"organization_id": organization_id}
 
         if project_id:
             properties["project_id"] = project_id
 
         self._track_event(
-            event_name="cli_generate", user_id=organization_id, properties=properties
+            event_name=event_name, user_id=organization_id, properties=properties
         )
 
+    def track_cli_generate(
+        self, organization_id: str, project_id: Optional[str]
+    ) -> None:
+        """Track CLI generate event."""
+        self._track_cli_event("cli_generate", organization_id, project_id)
+
     def track_cli_run(self, organization_id: str, project_id: Optional[str]) -> None:
         """Track CLI run event."""
-        properties = {
-            "organization_id": organization_id,
-        }
-
-        if project_id:
-            properties["project_id"] = project_id
-
-        self._track_event(
-            event_name="cli_run", user_id=organization_id, properties=properties
-        )
+        self._track_cli_event("cli_run", organization_id, project_id)
 
     def track_cli_update(self, organization_id: str, project_id: Optional[str]) -> None:
         """Track CLI update event."""
-        properties = {
-            "organization_id": organization_id,
-        }
-
-        if project_id:
-            properties["project_id"] = project_id
-
-        self._track_event(
-            event_name="cli_update", user_id=organization_id, properties=properties
-        )
+        self._track_cli_event("cli_update", organization_id, project_id)
 
     def track_cli_destructive(
         self, organization_id: str, project_id: Optional[str]
     ) -> None:
         """Track CLI destructive event."""
-        properties = {
-            "organization_id": organization_id,
-        }
+        self._track_cli_event("cli_destructive", organization_id, project_id)
 
-        if project_id:
-            properties["project_id"] = project_id
-
-        self._track_event(
-            event_name="cli_destructive", user_id=organization_id, properties=properties
-        )
-
-    def flush(self):
-        """Ensure all events are sent before CLI exits."""
+    def flush(self, timeout: float = FLUSH_TIMEOUT_SECONDS):
+        """Send queued events, waiting at most `timeout` seconds for delivery."""
         if self.enabled and hasattr(self, "_client"):
-            try:
-                if hasattr(self._client, "flush"):
+            if not hasattr(self._client, "flush"):
+                return
+
+            def _flush():
+                try:
                     self._client.flush()
-                logger.debug("Analytics events flushed")
-            except Exception as e:
-                logger.debug(f"Failed to flush analytics: {e}")
+                    logger.debug("Analytics events flushed")
+                except Exception as e:
+                    logger.debug("Failed to flush analytics: %s", e)
+
+            thread = threading.Thread(target=_flush, daemon=True)
+            thread.start()
+            thread.join(timeout=timeout)
+
+            if thread.is_alive():
+                logger.debug("Analytics flush timed out, exiting without waiting")
 
     @classmethod
     def create_opt_out_file(cls):
@@ -181,6 +193,8 @@ class PostHogClient:
             return True
         except Exception:
             return False
+        finally:
+            _opt_out_state.cache_clear()
 
     @classmethod
     def remove_opt_out_file(cls):
@@ -191,14 +205,13 @@ class PostHogClient:
             return True
         except Exception:
             return False
+        finally:
+            _opt_out_state.cache_clear()
 
     @classmethod
     def is_opted_out(cls) -> bool:
         """Check if user has opted out of analytics."""
-        return (
-            os.getenv(OPT_OUT_ENV_VAR, "").lower() in ("true", "1", "yes")
-            or OPT_OUT_FILE.exists()
-        )
+        return _opt_out_state() is not None
 
 
 # Global analytics instance
@@ -210,16 +223,27 @@ def get_analytics() -> PostHogClient:
     global _analytics_instance
     if _analytics_instance is None:
         _analytics_instance = PostHogClient()
+        atexit.register(_analytics_instance.flush)
     return _analytics_instance
 
 
+# Commands that emit a dedicated business event, mapped to their tracking method
+TRACKED_COMMAND_EVENTS = {
+    "generate": PostHogClient.track_cli_generate,
+    "run": PostHogClient.track_cli_run,
+    "update": PostHogClient.track_cli_update,
+    "destructive": PostHogClient.track_cli_destructive,
+}
+
+
 def track_command(command_name: str):
     """Decorator to track command execution time and success/failure."""
+    track_event = TRACKED_COMMAND_EVENTS.get(command_name)
 
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_ns = time.monotonic_ns()
             success = True
             error_type = None
 
@@ -235,8 +259,16 @@ def track_command(command_name: str):
                 error_type = type(e).__name__
                 raise
             finally:
+                logger.debug(
+                    "Command %s finished in %.3fs (success=%s, error=%s)",
+                    command_name,
+                    (time.monotonic_ns() - start_ns) / 1e9,
+                    success,
+                    error_type,
+                )
+
                 # Track specific events for generate, run, update, and destructive commands
-                if command_name in ["generate", "run", "update", "destructive"]:
+                if track_event is not None:
                     try:
                         analytics = get_analytics()
 
@@ -248,33 +280,20 @@ def track_command(command_name: str):
                             # Get project ID from config
                             project_id = None
                             try:
+                                from bugster.utils.file import load_config
+
                                 config = load_config()
                                 project_id = config.project_id
                             except Exception as e:
                                 logger.debug(
-                                    f"Could not load project_id from config: {e}"
+                                    "Could not load project_id from config: %s", e
                                 )
 
                             # Track the specific command
-                            if command_name == "generate":
-                                analytics.track_cli_generate(
-                                    organization_id, project_id
-                                )
-                            elif command_name == "run":
-                                analytics.track_cli_run(organization_id, project_id)
-                            elif command_name == "update":
-                                analytics.track_cli_update(organization_id, project_id)
-                            elif command_name == "destructive":
-                                analytics.track_cli_destructive(
-                                    organization_id, project_id
-                                )
+                            track_event(analytics, organization_id, project_id)
 
                     except Exception as e:
-                        logger.debug(f"Failed to track {command_name} command: {e}")
-
-                # Ensure events are sent
-                analytics = get_analytics()
-                analytics.flush()
+                        logger.debug("Failed to track %s command: %s", command_name, e)
 
         return wrapper
 
@@ -283,4 +302,11 @@ def track_command(command_name: str):
 
 # For backward compatibility
 BugsterAnalytics = PostHogClient
-posthog_client = get_analytics()
+
+
+def __getattr__(name: str):
+    """Create the legacy `posthog_client` instance on first access."""
+    if name == "posthog_client":
+        return get_analytics()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
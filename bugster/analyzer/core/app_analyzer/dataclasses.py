@@ -29,7 +29,7 @@ class ApiInfo:
     dependencies: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class FileInfo:
     relative_file_path: str
     relative_dir_path: str
@@ -48,7 +48,7 @@ class FrameworkInfo:
     dir_path: str
 
 
-@dataclass
+@dataclass(slots=True)
 class FileAnalysisResult:
     framework: str
     path: str
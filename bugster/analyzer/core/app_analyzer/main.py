@@ -1,33 +1,47 @@
-import json
+import functools
 import os
 
 from loguru import logger
 
-from bugster.analyzer.core.app_analyzer.nextjs_analyzer import NextjsAnalyzer
+from bugster.analyzer.core.app_analyzer.nextjs_analyzer import (
+    NextjsAnalyzer,
+    load_analysis,
+)
 from bugster.analyzer.core.framework_detector import get_project_info
 from bugster.analyzer.utils.errors import BugsterError
 from bugster.constants import BUGSTER_DIR
 
-SUPPORTED_FRAMEWORKS_IDS = ["next"]
+SUPPORTED_FRAMEWORKS_IDS = frozenset({"next"})
 
 
 def detect_supported_framework():
     """Detect the supported framework."""
     project_info = get_project_info()
-    supported_frameworks = [
+    supported_frameworks = (
         f
         for f in project_info["data"]["frameworks"]
         if f["id"] in SUPPORTED_FRAMEWORKS_IDS
-    ]
+    )
+    framework = next(supported_frameworks, None)
 
-    if len(supported_frameworks) == 0:
+    if framework is None:
         raise BugsterError("No supported framework found")
 
-    if len(supported_frameworks) > 1:
-        frameworks_names = ", ".join([f.name for f in supported_frameworks])
+    other_framework = next(supported_frameworks, None)
+
+    if other_framework is not None:
+        frameworks_names = ", ".join(
+            f["name"] for f in (framework, other_framework, *supported_frameworks)
+        )
         raise BugsterError(f"Multiple supported frameworks found: {frameworks_names}")
 
-    return supported_frameworks[0]
+    return framework
+
+
+@functools.lru_cache(maxsize=None)
+def _analysis_path(framework_id: str) -> str:
+    """Get the cached `analysis.json` path for a framework."""
+    return os.path.join(BUGSTER_DIR, framework_id, "analysis.json")
 
 
 def get_existing_analysis(framework_id):
@@ -35,27 +49,16 @@ def get_existing_analysis(framework_id):
     logger.info("Getting existing analysis: {}", {"frameworkId": framework_id})
 
     try:
-        cache_framework_dir = os.path.join(BUGSTER_DIR, framework_id)
-        analysis_json_path = os.path.join(cache_framework_dir, "analysis.json")
+        analysis_json_path = _analysis_path(framework_id)
 
         try:
-            exists = os.access(analysis_json_path, os.F_OK)
-
-            if not exists:
-                logger.info(
-                    "Analysis file does not exist at: {}. Creating new analysis...",
-                    analysis_json_path,
-                )
-                return None
-        except Exception as err:
-            logger.error("Failed to check if analysis file exists: {}", err)
+            return load_analysis(analysis_json_path)["data"]
+        except FileNotFoundError:
+            logger.info(
+                "Analysis file does not exist at: {}. Creating new analysis...",
+                analysis_json_path,
+            )
             return None
-
-        with open(analysis_json_path, "r", encoding="utf-8") as file:
-            analysis_json = file.read()
-
-        analysis_data = json.loads(analysis_json)
-        return analysis_data["data"]
     except Exception as error:
         logger.error("Failed to read existing analysis: {}", error)
         return None
@@ -66,37 +69,30 @@ class AppAnalyzer:
 
     def __init__(self, framework_info):
         self.framework_info = framework_info
+        self.framework_id = framework_info["id"]
+        self.framework_name = framework_info["name"]
 
     def execute(self, options: dict = {}):
         """Execute the analysis."""
-        logger.info(
-            "Analyzing application: {}", {"framework": self.framework_info["id"]}
-        )
+        logger.info("Analyzing application: {}", {"framework": self.framework_id})
         analysis = None
 
-        if not options.get("force"):
-            existing_analysis = get_existing_analysis(
-                framework_id=self.framework_info["id"]
-            )
-
-            if existing_analysis:
-                logger.info("Using existing analysis from cache...")
-                return existing_analysis
-        if self.framework_info["id"] == "next":
-            analysis = self.analyze_next_js()
+        # The saved analysis is reused by the framework analyzer, only while the source files are unchanged
+        if self.framework_id == "next":
+            analysis = self.analyze_next_js(force=bool(options.get("force")))
         else:
-            raise BugsterError(f"Unsupported framework: {self.framework_info['id']}")
+            raise BugsterError(f"Unsupported framework: {self.framework_id}")
 
-        logger.info("Analysis complete for {} framework", self.framework_info["name"])
+        logger.info("Analysis complete for {} framework", self.framework_name)
         return analysis
 
-    def analyze_next_js(self):
-        """Analyze the Next.js application."""
+    def analyze_next_js(self, force: bool = False):
+        """Analyze the Next.js application, regenerating the analysis even if it is up to date when `force` is set."""
         logger.info("Starting Next.js analysis...")
 
         try:
             next_analyzer = NextjsAnalyzer(framework_info=self.framework_info)
-            analysis = next_analyzer.execute()
+            analysis = next_analyzer.execute(force=force)
             logger.info("Next.js analysis completed successfully!")
             return analysis
         except Exception as error:
@@ -1,11 +1,17 @@
-import json
+import functools
+import hashlib
 import os
 import re
+import sys
 import time
-from typing import Dict, List, Optional
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, List, Optional
 
 from loguru import logger
 
+from bugster import __version__
 from bugster.analyzer.core.app_analyzer.dataclasses import (
     ApiInfo,
     AppAnalysis,
@@ -16,21 +22,305 @@ from bugster.analyzer.core.app_analyzer.dataclasses import (
     PageInfo,
 )
 from bugster.analyzer.core.app_analyzer.utils.get_tree_structure import (
+    TreeNode,
+    build_tree_from_paths,
     get_paths,
-    get_tree_structure,
 )
 from bugster.analyzer.utils.assert_utils import assert_defined
 from bugster.analyzer.utils.get_git_info import get_git_info
 from bugster.constants import BUGSTER_DIR
+from bugster.utils import json_io
+
+PARSED_FILE_EXTENSIONS = (".js", ".jsx", ".ts", ".tsx")
+# Reading source files is I/O-bound, so more workers than cores overlap the disk latency
+READ_MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+# Content analysis is CPU-bound regex scanning, it is spread over worker processes once there are enough
+# files to amortize their startup
+ANALYSIS_MIN_PARALLEL_FILES = 256
+ANALYSIS_CHUNK_SIZE = 32
+
+# Next.js App Router special files, e.g. `page.tsx` or `route.ts`
+ROUTING_FILE_SUFFIXES = (
+    *(
+        f"{name}.{extension}"
+        for name in (
+            "layout",
+            "page",
+            "loading",
+            "not-found",
+            "error",
+            "global-error",
+            "template",
+            "default",
+        )
+        for extension in ("js", "jsx", "tsx")
+    ),
+    "route.js",
+    "route.ts",
+)
+APP_PAGE_FILE_NAMES = ("page.js", "page.tsx")
+APP_LAYOUT_FILE_NAMES = ("layout.js", "layout.tsx")
+APP_ROUTE_HANDLER_FILE_NAMES = ("route.js", "route.tsx")
+LAYOUT_FILE_RE = re.compile(r"^layout\.(?:jsx?|tsx)$")
+EXPORT_DEFAULT_NAME_RE = re.compile(r"export\s+default\s+(\w+)")
+EXPORT_DEFAULT_FUNCTION_RE = re.compile(r"export\s+default\s+(?:function\s+)?(\w+)")
+EXPORT_NAMED_RE = re.compile(r"export\s+(const|let|var|function)\s+(\w+)")
+LAYOUT_FUNCTION_RE = re.compile(r"function\s+(\w*Layout\w*)\s*\(")
+COMPONENT_RE = re.compile(r"<([A-Z]\w+)")
+IMPORT_RE = re.compile(r"import\s+(?:{([^}]+)}|([^{}\s;]+))\s+from")
+WORD_RE = re.compile(r"(\w+)")
+HOOK_RE = re.compile(r"\b(use[A-Z]\w*)\s*\(")
+FORM_SUBMISSION_MARKERS = ("<form", "onSubmit", "handleSubmit")
+# HTTP methods compared against `req.method`, or express-like `get(` handler calls
+API_METHOD_RE = re.compile(
+    r"req\.method\s*===?\s*['\"](GET|POST|PUT|DELETE|PATCH)['\"]"
+    r"|\b(get|post|put|delete|patch)\s*\(",
+    re.IGNORECASE,
+)
+INPUT_VALIDATION_RE = re.compile(r"\b(?:validate|schema|yup|zod|joi)\b")
+APP_ROUTE_FILE_SUFFIXES = tuple(
+    f"/{name}{extension}"
+    for name in ("page", "route", "layout")
+    for extension in (".js", ".jsx", ".ts", ".tsx")
+)
+DYNAMIC_SEGMENT_RE = re.compile(r"/\[([^\]]+)\]")
+EVENT_HANDLER_RE = re.compile(
+    r"(?:function|const|let|var)\s+((handle|on)[A-Z]\w*|\w+(Click|Change|Submit|Focus|Blur))"
+)
+
+
+def read_file_content(file_path: str) -> Optional[str]:
+    """Read a source file, logging the error and returning `None` if it can't be read."""
+    try:
+        logger.debug("Reading file: {}", {"path": file_path})
+
+        # Slurp the raw bytes and decode them once instead of going through a text wrapper
+        with open(file_path, "rb") as f:
+            content = f.read().decode("utf-8")
+
+        # Translate newlines like a text-mode read does
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+
+        return content
+    except Exception as error:
+        logger.error("Error reading file {}: {}", file_path, error)
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def _load_analysis_cached(analysis_json_path: str, mtime_ns: int, size: int) -> dict:
+    """Load the metadata and data of an analysis file, memoized by its path, mtime and size."""
+    with open(analysis_json_path, "rb") as file:
+        return json_io.load_members(file, ("metadata", "data"), size=size)
+
+
+def load_analysis(analysis_json_path: str) -> dict:
+    """Load the metadata and data of an analysis file, raising `FileNotFoundError` if it does not exist."""
+    stat = os.stat(analysis_json_path)
+    return _load_analysis_cached(analysis_json_path, stat.st_mtime_ns, stat.st_size)
+
+
+def is_app_router_file(file: FileInfo) -> bool:
+    """Check if a file is a special App Router file (page, layout, route, loading...)."""
+    return file.name.endswith(ROUTING_FILE_SUFFIXES)
+
+
+def is_pages_router_file(file: FileInfo) -> bool:
+    """Check if a file is a Pages Router page or API route."""
+    return (
+        (
+            "/pages/" in file.relative_dir_path
+            or file.relative_dir_path.startswith("pages/")
+        )
+        and not file.name.startswith("_")
+        and file.name != "api"
+    )
+
+
+def is_below_app_dir(file: FileInfo) -> bool:
+    """Check if a file below a `pages` directory is in an `app` directory above it (e.g. `src/app/pages/`)."""
+    dir_names = file.relative_dir_path.split("/")
+    return "app" in dir_names[: dir_names.index("pages")]
+
+
+def is_pages_api_route_file(file: FileInfo) -> bool:
+    """Check if a file is a Pages Router API route, below `pages/api/` (or `src/pages/api/`)."""
+    return (
+        file.relative_file_path.startswith("pages/api/")
+        or "/pages/api/" in file.relative_file_path
+    )
+
+
+def is_app_api_route_file(file: FileInfo) -> bool:
+    """Check if an App Router file is an API route, a route handler or a file below an `api` directory."""
+    return file.name not in APP_PAGE_FILE_NAMES + APP_LAYOUT_FILE_NAMES and (
+        file.name in APP_ROUTE_HANDLER_FILE_NAMES or "/api/" in file.relative_file_path
+    )
+
+
+def is_analyzed_file(file: FileInfo) -> bool:
+    """Check if the content of a file is analyzed, as a layout or as a route file."""
+    return bool(
+        LAYOUT_FILE_RE.match(file.name)
+        or is_app_router_file(file)
+        or is_pages_router_file(file)
+        or "/api/" in file.relative_file_path
+    )
+
+
+def analyze_content(content: str) -> Dict[str, List[str]]:
+    """Extract the imports, exports, hooks, event handlers and components from the content."""
+    # Each extractor keeps its own scan, their matches can overlap (e.g. `export const handleClick`)
+    return {
+        "imports": extract_imports(content),
+        "exports": extract_exports(content),
+        "hooks": extract_hooks(content),
+        "eventHandlers": extract_event_handlers(content),
+        "components": extract_components(content),
+    }
+
+
+def analyze_api_route_content(content: str) -> Dict[str, List[str]]:
+    """Extract the imports from the content of an API route, the only analysis its route info uses."""
+    return {"imports": extract_imports(content)}
+
+
+def analyze_contents(
+    contents: List[str],
+    analyze: Callable[[str], Dict[str, List[str]]] = analyze_content,
+) -> List[Dict[str, List[str]]]:
+    """Analyze each of the contents with `analyze`, in worker processes when there are enough of them.
+
+    Boilerplate files (re-exported routes, generated pages) often share the same content, so identical contents
+    are analyzed once and share their result, which must not be mutated.
+    """
+    unique_contents = list(dict.fromkeys(contents))
+
+    if len(unique_contents) < ANALYSIS_MIN_PARALLEL_FILES or (os.cpu_count() or 1) < 2:
+        results = [analyze(content) for content in unique_contents]
+    else:
+        try:
+            with ProcessPoolExecutor() as executor:
+                results = list(
+                    executor.map(
+                        analyze,
+                        unique_contents,
+                        chunksize=ANALYSIS_CHUNK_SIZE,
+                    )
+                )
+        except (BrokenProcessPool, OSError) as error:
+            logger.warning(
+                "Failed to analyze files in parallel, analyzing them serially: {}",
+                error,
+            )
+            results = [analyze(content) for content in unique_contents]
+
+    results_by_content = dict(zip(unique_contents, results, strict=True))
+    return [results_by_content[content] for content in contents]
+
+
+def extract_imports(content: str) -> List[str]:
+    """Extract the imports from the content."""
+    # Simplified import extraction using regex, skipped by a substring check when nothing can match
+    if "import" not in content:
+        return []
+
+    imports = []
+
+    for match in IMPORT_RE.finditer(content):
+        if match.group(1):  # Named imports
+            imports.extend(map(sys.intern, WORD_RE.findall(match.group(1))))
+        elif match.group(2):  # Default import
+            imports.append(sys.intern(match.group(2)))
+
+    return imports
 
 
-class TreeNode:
-    def __init__(self, name: str, path: str, node_type: str):
-        self.name = name
-        self.path = path
-        self.type = node_type
-        self.children = []
-        self.extension = os.path.splitext(name)[1] if node_type == "file" else None
+def extract_exports(content: str) -> List[str]:
+    """Extract the exports from the content."""
+    # Simplified export extraction using regex, skipped by a substring check when nothing can match
+    if "export" not in content:
+        return []
+
+    exports = []
+
+    # Named exports
+    for match in EXPORT_NAMED_RE.finditer(content):
+        exports.append(match.group(2))
+
+    # Default exports
+    default_names = set()
+
+    for match in EXPORT_DEFAULT_FUNCTION_RE.finditer(content):
+        exports.append(f"{match.group(1)} (default)")
+        default_names.add(match.group(1))
+
+    # Default exports of variables/consts
+    for match in EXPORT_DEFAULT_NAME_RE.finditer(content):
+        if match.group(1) not in default_names:
+            exports.append(f"{match.group(1)} (default)")
+            default_names.add(match.group(1))
+
+    if not any("default" in exp for exp in exports) and "export default" in content:
+        exports.append("(anonymous default export)")
+
+    return exports
+
+
+def extract_hooks(content: str) -> List[str]:
+    # Find React hooks (functions starting with "use" followed by uppercase), deduplicated in order
+    if "use" not in content:
+        return []
+
+    return list(
+        dict.fromkeys(sys.intern(match.group(1)) for match in HOOK_RE.finditer(content))
+    )
+
+
+def extract_event_handlers(content: str) -> List[str]:
+    """Extract the event handlers from the content."""
+    # Find event handler declarations based on naming patterns, deduplicated in order
+    return list(
+        dict.fromkeys(
+            sys.intern(match.group(1)) for match in EVENT_HANDLER_RE.finditer(content)
+        )
+    )
+
+
+def has_form_submission(content: str) -> bool:
+    """Check if the content has a form submission."""
+    # Check for form elements or onSubmit handlers
+    return any(marker in content for marker in FORM_SUBMISSION_MARKERS)
+
+
+def extract_api_methods(content: str) -> List[str]:
+    """Extract the API methods from the content."""
+    # Extract HTTP methods from API route handlers in a single scan
+    methods = set()
+
+    for match in API_METHOD_RE.finditer(content):
+        methods.add((match.group(1) or match.group(2)).upper())
+
+    return list(methods)
+
+
+def has_input_validation(content: str) -> bool:
+    """Check if the content has input validation."""
+    # Check for common validation libraries or patterns
+    return bool(INPUT_VALIDATION_RE.search(content))
+
+
+def extract_components(content: str) -> List[str]:
+    """Extract the components from the content."""
+    # Simplified component extraction that looks for JSX components (capitalized tags)
+    # Names repeat across files, so extracted names are interned to share a single copy
+    if "<" not in content:
+        return []
+
+    return list(
+        {sys.intern(match.group(1)) for match in COMPONENT_RE.finditer(content)}
+    )
 
 
 class NextjsAnalyzer:
@@ -41,6 +331,8 @@ class NextjsAnalyzer:
         self.routes: List[str] = []
         self.api_routes: List[str] = []
         self.results: List[FileAnalysisResult] = []
+        self.results_by_path: Dict[str, FileAnalysisResult] = {}
+        self.content_analysis_by_path: Dict[str, Dict[str, List[str]]] = {}
         self.pages: List[PageInfo] = []
         self.paths: List[str] = []
         self.apis: List[ApiInfo] = []
@@ -50,9 +342,11 @@ class NextjsAnalyzer:
         self.NEXT_ANALYSIS_VERSION = 2
         self.framework_info = framework_info
         self.cache_framework_dir = os.path.join(BUGSTER_DIR, self.framework_info["id"])
+        self.sources_hash: Optional[str] = None
 
-    def execute(self) -> AppAnalysis:
-        """Execute the Next.js analyzer."""
+    def execute(self, force: bool = False) -> AppAnalysis:
+        """Execute the Next.js analyzer, reusing the saved analysis if the source files are unchanged unless `force`
+        is set."""
         logger.info("Executing Next.js analyzer...")
         self.layouts = {}
         self.routes = []
@@ -63,6 +357,13 @@ class NextjsAnalyzer:
         self.is_app_router = False
         self.is_pages_router = False
         self.set_paths()
+        self.sources_hash = self.get_sources_hash()
+        cached_analysis = None if force else self.get_cached_analysis()
+
+        if cached_analysis:
+            logger.info("Source files unchanged since the last analysis, reusing it...")
+            return cached_analysis
+
         self.set_tree_structure()
         logger.info("Processing {} files", len(self.file_infos))
         self.detect_router_type()
@@ -83,98 +384,127 @@ class NextjsAnalyzer:
         """Set the paths for the NextJs analyzer."""
         logger.info("Retrieving folder paths for Next.js analyzer...")
         self.paths = get_paths(dir_path=self.framework_info["dir_path"])
-        os.makedirs(self.cache_framework_dir, exist_ok=True)
-        paths_output = {
-            "metadata": {
-                "timestamp": time.time(),
-                "version": self.NEXT_ANALYSIS_VERSION,
-                "git": get_git_info(),
-            },
-            "data": {
-                "framework": self.framework_info,
-                "paths": self.paths,
-            },
-        }
 
-    def set_tree_structure(self) -> None:
-        """Set the tree structure for the NextJs analyzer."""
-        logger.info("Building tree structure for Next.js analyzer...")
+    def get_sources_hash(self) -> Optional[str]:
+        """Get a hash of the CLI version, the framework info and the path, modification time and size of every
+        source file."""
+        digest = hashlib.blake2b(digest_size=16)
+        # A new CLI version can analyze the same sources differently
+        digest.update(f"{__version__}\0".encode())
+        digest.update(repr(sorted(self.framework_info.items())).encode("utf-8"))
+        source_dir = self.framework_info["dir_path"]
 
-        try:
-            tree_node = get_tree_structure(source_dir=self.framework_info["dir_path"])
-            self.set_file_infos(node=tree_node)
-            os.makedirs(self.cache_framework_dir, exist_ok=True)
+        for path in self.paths:
+            try:
+                stat = os.stat(os.path.join(source_dir, path))
+            except OSError:
+                return None
 
-            def node_to_dict(node):
-                result = {
-                    "name": node["name"],
-                    "path": node["path"],
-                    "type": node["type"],
-                }
+            digest.update(f"{path}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode())
 
-                if "extension" in node:
-                    result["extension"] = node["extension"]
+        return digest.hexdigest()
 
-                if "children" in node:
-                    result["children"] = [
-                        node_to_dict(child) for child in node["children"]
-                    ]
+    def get_cached_analysis(self) -> Optional[AppAnalysis]:
+        """Get the saved analysis if it was generated from the same source files."""
+        if not self.sources_hash:
+            return None
 
-                return result
+        analysis_json_path = os.path.join(self.cache_framework_dir, "analysis.json")
 
-            tree_output = {
-                "metadata": {
-                    "timestamp": time.time(),
-                    "version": self.NEXT_ANALYSIS_VERSION,
-                    "git": get_git_info(),
-                },
-                "data": {
-                    "framework": self.framework_info,
-                    "node": node_to_dict(tree_node),
-                },
-            }
+        try:
+            output = load_analysis(analysis_json_path)
+            metadata = output["metadata"]
+
+            if (
+                metadata.get("version") != self.NEXT_ANALYSIS_VERSION
+                or metadata.get("hash") != self.sources_hash
+            ):
+                return None
+
+            data = output["data"]
+            return AppAnalysis(
+                **{
+                    **data,
+                    "layouts": [LayoutInfo(**layout) for layout in data["layouts"]],
+                }
+            )
+        except FileNotFoundError:
+            return None
+        except Exception as error:
+            logger.error("Failed to read cached analysis: {}", error)
+            return None
+
+    def set_tree_structure(self) -> None:
+        """Set the tree structure for the NextJs analyzer."""
+        logger.info("Building tree structure for Next.js analyzer...")
+
+        try:
+            # Reuse the paths listed by `set_paths` instead of walking the directory again
+            tree_node = build_tree_from_paths(
+                root_name=os.path.basename(self.framework_info["dir_path"]),
+                paths=self.paths,
+            )
+            self.set_file_infos(node=tree_node)
         except Exception as error:
             logger.error("Failed to build tree structure: {}", error)
             raise error
 
     def set_file_infos(self, node: TreeNode) -> None:
         """Set the file infos for the NextJs analyzer."""
-        if node.get("type") == "directory" and node["children"]:
-            for child in node["children"]:
-                self.set_file_infos(child)
-        elif node.get("type") == "file":
-            self.file_infos.append(
-                FileInfo(
-                    relative_file_path=node.get("path"),
-                    relative_dir_path=os.path.dirname(node.get("path")),
-                    absolute_file_path=os.path.join(
-                        self.framework_info["dir_path"], node["path"]
-                    ),
-                    name=node.get("name"),
-                    extension=node.get("extension"),
-                    content=None,
-                    ast_parsed=None,
+        # The tree paths are relative, so joining them is a plain concatenation onto the source directory
+        source_dir_prefix = os.path.join(self.framework_info["dir_path"], "")
+        # Depth-first with an explicit stack, children are pushed reversed to keep the tree order
+        stack = [node]
+
+        while stack:
+            node = stack.pop()
+            node_type = node.get("type")
+
+            if node_type == "directory":
+                stack.extend(reversed(node["children"]))
+            elif node_type == "file":
+                file_path = node["path"]
+                self.file_infos.append(
+                    FileInfo(
+                        relative_file_path=file_path,
+                        relative_dir_path=os.path.dirname(file_path),
+                        absolute_file_path=source_dir_prefix + file_path,
+                        name=node["name"],
+                        extension=node["extension"],
+                        content=None,
+                        ast_parsed=None,
+                    )
                 )
-            )
 
     def generate_analysis(self) -> AppAnalysis:
         """Generate the analysis for the NextJs analyzer."""
-        route_info_list = [
-            {
-                "routePath": page.route_path,
-                "relativeFilePath": page.relative_file_path,
-                "layoutChain": self.get_layout_chain_for_page(page.relative_file_path),
-                "components": page.components,
-                "hasParams": page.has_params,
-                "hasForm": page.has_form_submission,
-                "hooks": self.get_hooks_for_file(page.relative_file_path),
-                "eventHandlers": self.get_event_handlers_for_file(
-                    page.relative_file_path
-                ),
-                "featureFlags": [],
-            }
-            for page in self.pages
-        ]
+        layout_names_by_dir: Dict[str, List[str]] = {}
+
+        for name, layout in self.layouts.items():
+            layout_names_by_dir.setdefault(layout.relative_dir_path, []).append(name)
+
+        route_info_list = []
+
+        for page in self.pages:
+            result = self.results_by_path.get(page.relative_file_path)
+            details = result.details if result else {}
+            route_info_list.append(
+                {
+                    "routePath": page.route_path,
+                    "relativeFilePath": page.relative_file_path,
+                    "layoutChain": self.get_layout_chain_for_page(
+                        filepath=page.relative_file_path,
+                        layout_names_by_dir=layout_names_by_dir,
+                    ),
+                    "components": page.components,
+                    "hasParams": page.has_params,
+                    "hasForm": page.has_form_submission,
+                    "hooks": details.get("hooks", []),
+                    "eventHandlers": details.get("eventHandlers", []),
+                    "featureFlags": [],
+                }
+            )
+
         api_route_info_list = [
             {
                 "routePath": api.route_path,
@@ -207,43 +537,19 @@ class NextjsAnalyzer:
             all_paths=self.paths,
         )
 
-    def get_layout_chain_for_page(self, filepath: str) -> List[str]:
-        """Get the layout chain for a page."""
+    def get_layout_chain_for_page(
+        self, filepath: str, layout_names_by_dir: Dict[str, List[str]]
+    ) -> List[str]:
+        """Get the layout chain for a page, from the closest layout up to the root one."""
         file_dir_path = os.path.dirname(filepath)
-        layout_info = [
-            {
-                "name": name,
-                "relative_dir_path": layout.relative_dir_path,
-                "distance": self.get_directory_distance(
-                    from_path=file_dir_path, to_path=layout.relative_dir_path
-                ),
-            }
-            for name, layout in self.layouts.items()
-        ]
-        filtered_layouts = [layout for layout in layout_info if layout["distance"] >= 0]
-        sorted_layouts = sorted(filtered_layouts, key=lambda x: x["distance"])
-        return [layout["name"] for layout in sorted_layouts]
-
-    def get_directory_distance(self, from_path: str, to_path: str) -> int:
-        """Get the distance between two directories."""
-        # If 'to' is not a parent directory of 'from', return -1
-        if not from_path.startswith(to_path):
-            return -1
-
-        # Count directory levels between 'from' and 'to'
-        from_parts = from_path.split("/")
-        to_parts = to_path.split("/")
-        return len(from_parts) - len(to_parts)
-
-    def get_hooks_for_file(self, filepath: str) -> List[str]:
-        """Get the hooks for a file."""
-        result = next((r for r in self.results if r.path == filepath), None)
-        return result.details.get("hooks", []) if result else []
-
-    def get_event_handlers_for_file(self, filepath: str) -> List[str]:
-        """Get the event handlers for a file."""
-        result = next((r for r in self.results if r.path == filepath), None)
-        return result.details.get("eventHandlers", []) if result else []
+        parts = file_dir_path.split("/") if file_dir_path else []
+        layout_chain = []
+
+        # Ascend from the page directory, picking up the layouts of each ancestor
+        for index in range(len(parts), -1, -1):
+            layout_chain.extend(layout_names_by_dir.get("/".join(parts[:index]), []))
+
+        return layout_chain
 
     def save_analysis_to_file(self, analysis: AppAnalysis) -> None:
         """Save the analysis to a file."""
@@ -251,28 +557,18 @@ class NextjsAnalyzer:
             os.makedirs(self.cache_framework_dir, exist_ok=True)
             analysis_json_path = os.path.join(self.cache_framework_dir, "analysis.json")
 
-            # Convert AppAnalysis to dict for JSON serialization
-            def serialize_analysis(obj):
-                if hasattr(obj, "__dict__"):
-                    return {k: serialize_analysis(v) for k, v in obj.__dict__.items()}
-                elif isinstance(obj, list):
-                    return [serialize_analysis(item) for item in obj]
-                elif isinstance(obj, dict):
-                    return {k: serialize_analysis(v) for k, v in obj.items()}
-                else:
-                    return obj
-
             output = {
                 "metadata": {
                     "timestamp": time.time(),
                     "version": self.NEXT_ANALYSIS_VERSION,
                     "git": get_git_info(),
+                    "hash": self.sources_hash,
                 },
-                "data": serialize_analysis(analysis),
+                "data": analysis,
             }
 
-            with open(analysis_json_path, "w", encoding="utf-8") as f:
-                json.dump(output, f, indent=2)
+            with open(analysis_json_path, "wb") as f:
+                json_io.dump(output, f)
 
             logger.info("Analysis saved to {}", {"path": analysis_json_path})
         except Exception as error:
@@ -281,70 +577,69 @@ class NextjsAnalyzer:
 
     def parse_files(self) -> None:
         """Parse the files for the NextJs analyzer."""
-        file_extensions = [".js", ".jsx", ".ts", ".tsx"]
         logger.info(
             "Parsing eligible files: {}",
             {
-                "extensions": file_extensions,
+                "extensions": list(PARSED_FILE_EXTENSIONS),
             },
         )
 
-        for ext in file_extensions:
-            files = [file for file in self.file_infos if file.extension == ext]
-            logger.info("Found {} files with extension: {}", len(files), ext)
+        files = [
+            file for file in self.file_infos if file.extension in PARSED_FILE_EXTENSIONS
+        ]
+        extension_counts = Counter(file.extension for file in files)
+        # Only layouts and route files are analyzed, the other sources are never read
+        unread_files = [
+            file for file in files if not file.content and is_analyzed_file(file)
+        ]
+
+        if unread_files:
+            read_start = time.perf_counter()
+
+            with ThreadPoolExecutor(
+                max_workers=min(READ_MAX_WORKERS, len(unread_files))
+            ) as executor:
+                contents = executor.map(
+                    read_file_content,
+                    [file.absolute_file_path for file in unread_files],
+                )
+
+                for file, content in zip(unread_files, contents, strict=True):
+                    file.content = content
 
-            for file in files:
+            logger.info(
+                "Read {} files in {:.2f}s",
+                len(unread_files),
+                time.perf_counter() - read_start,
+            )
+
+        for file in files:
+            if not file.ast_parsed and file.content:
                 try:
-                    if not file.content:
-                        try:
-                            logger.info(
-                                "Reading file: {}", {"path": file.relative_file_path}
-                            )
-                            with open(
-                                os.path.join(
-                                    self.framework_info["dir_path"],
-                                    file.relative_file_path,
-                                ),
-                                encoding="utf-8",
-                            ) as f:
-                                file.content = f.read()
-                        except Exception as read_error:
-                            logger.error(
-                                "Error reading file {}: {}",
-                                file.relative_file_path,
-                                read_error,
-                            )
-                            continue
-
-                    if not file.ast_parsed and file.content:
-                        try:
-                            # Note: Python's ast module is not equivalent to
-                            # JavaScript's babel parser, this is a simplification
-                            # In a second iteration, we'll use a proper JS parser in Python
-                            file.ast_parsed = file.content
-                            # Placeholder for actual parsing — we'll use
-                            # a JS parser library like `esprima-python`
-                        except Exception as parse_error:
-                            logger.error(
-                                "Error parsing file {}:{}",
-                                file.relative_file_path,
-                                parse_error,
-                            )
-                except Exception as error:
+                    # Note: Python's ast module is not equivalent to
+                    # JavaScript's babel parser, this is a simplification
+                    # In a second iteration, we'll use a proper JS parser in Python
+                    file.ast_parsed = file.content
+                    # Placeholder for actual parsing — we'll use
+                    # a JS parser library like `esprima-python`
+                except Exception as parse_error:
                     logger.error(
-                        "Unexpected error processing file {}:{}",
+                        "Error parsing file {}:{}",
                         file.relative_file_path,
-                        error,
+                        parse_error,
                     )
 
+        logger.info(
+            "Found files per extension: {}",
+            {ext: extension_counts[ext] for ext in PARSED_FILE_EXTENSIONS},
+        )
+
         logger.info("File parsing complete!")
 
     def process_layout_files(self) -> None:
         """Process the layout files for the NextJs analyzer."""
         layout_file_infos = [
-            file
-            for file in self.file_infos
-            if re.match(r"^layout\.(jsx?|tsx)$", file.name)
+            file for file in self.file_infos if LAYOUT_FILE_RE.match(file.name)
         ]
 
         for layout_file_info in layout_file_infos:
@@ -372,20 +667,20 @@ class NextjsAnalyzer:
                 relative_file_path=layout_file_info.relative_file_path,
                 relative_dir_path=layout_file_info.relative_dir_path,
                 content=content,
-                components=self._extract_components_from_content(content=content),
+                components=extract_components(content=content),
             )
             self.layouts[layout_name] = layout_info
 
     def _extract_layout_name(self, content: str, file_path: str) -> Optional[str]:
         """Extract the layout name from the content."""
         # Simplified layout name extraction that looks for export default
-        export_default_match = re.search(r"export\s+default\s+(\w+)", content)
+        export_default_match = EXPORT_DEFAULT_NAME_RE.search(content)
 
         if export_default_match:
             return export_default_match.group(1)
 
         # Try to find function declaration with "Layout" in name
-        layout_func_match = re.search(r"function\s+(\w*Layout\w*)\s*\(", content)
+        layout_func_match = LAYOUT_FUNCTION_RE.search(content)
 
         if layout_func_match:
             return layout_func_match.group(1)
@@ -398,14 +693,6 @@ class NextjsAnalyzer:
 
         return "Layout"  # Last resort
 
-    def _extract_components_from_content(self, content: str) -> List[str]:
-        """Extract the components from the content."""
-        # Simplified component extraction that looks for JSX components (capitalized tags)
-        components = set()
-        component_matches = re.findall(r"<([A-Z]\w+)", content)
-        components.update(component_matches)
-        return list(components)
-
     def detect_router_type(self) -> None:
         """Detect the router type for the NextJs analyzer."""
         self.is_app_router = any(
@@ -435,22 +722,43 @@ class NextjsAnalyzer:
                 "is_pages_router": self.is_pages_router,
             },
         )
-        ROUTING_FILE_PATTERNS = [
-            r"layout\.(js|jsx|tsx)$",
-            r"page\.(js|jsx|tsx)$",
-            r"loading\.(js|jsx|tsx)$",
-            r"not-found\.(js|jsx|tsx)$",
-            r"error\.(js|jsx|tsx)$",
-            r"global-error\.(js|jsx|tsx)$",
-            r"route\.(js|ts)$",
-            r"template\.(js|jsx|tsx)$",
-            r"default\.(js|jsx|tsx)$",
-        ]
-        app_router_files = [
-            file
-            for file in self.file_infos
-            if any(re.search(pattern, file.name) for pattern in ROUTING_FILE_PATTERNS)
-        ]
+        app_router_files = []
+        pages_files = []
+        api_files = []
+        api_route_files = []
+
+        # Partition the files in a single pass, each file is processed by a single pass
+        for file in self.file_infos:
+            in_app_router = is_app_router_file(file)
+            in_pages_router = is_pages_router_file(file)
+
+            # Files named like App Router special files below a `pages` directory are Pages Router pages
+            # (e.g. `src/pages/blog/page.tsx`), unless they are in an `app` directory (e.g. `src/app/pages/`)
+            if in_app_router and in_pages_router:
+                in_app_router = is_below_app_dir(file)
+                in_pages_router = not in_app_router
+
+            if in_app_router:
+                app_router_files.append(file)
+                is_api_route = is_app_api_route_file(file)
+            elif in_pages_router:
+                pages_files.append(file)
+                is_api_route = is_pages_api_route_file(file)
+            # API routes under the App Router or Pages Router are already processed by their passes
+            elif "/api/" in file.relative_file_path:
+                # Either handler processes the remaining files below an `api` directory as API routes
+                api_files.append(file)
+                is_api_route = True
+            else:
+                continue
+
+            if is_api_route:
+                api_route_files.append(file)
+
+        self.set_content_analysis(
+            files=app_router_files + pages_files + api_files,
+            api_route_files=api_route_files,
+        )
 
         if app_router_files or self.is_app_router:
             self.is_app_router = True
@@ -459,17 +767,6 @@ class NextjsAnalyzer:
             for file in app_router_files:
                 self.process_app_router_file(file)
 
-        pages_files = [
-            file
-            for file in self.file_infos
-            if (
-                "/pages/" in file.relative_dir_path
-                or file.relative_dir_path.startswith("pages/")
-            )
-            and not file.name.startswith("_")
-            and file.name != "api"
-        ]
-
         if pages_files or self.is_pages_router:
             self.is_pages_router = True
             logger.info("Found {} Pages Router files", len(pages_files))
@@ -477,13 +774,10 @@ class NextjsAnalyzer:
             for file in pages_files:
                 self.process_pages_router_file(file)
 
-        api_files = [
-            file for file in self.file_infos if "/api/" in file.relative_file_path
-        ]
         logger.info("Found {} API files", len(api_files))
 
         for file in api_files:
-            if file.relative_file_path.startswith("pages/api/"):
+            if is_pages_api_route_file(file):
                 self.process_pages_router_file(file)
             else:
                 self.process_app_router_file(file)
@@ -494,6 +788,50 @@ class NextjsAnalyzer:
             len(self.api_routes),
         )
 
+    def set_content_analysis(
+        self, files: List[FileInfo], api_route_files: List[FileInfo]
+    ) -> None:
+        """Analyze the contents of the route files up front, so it can be spread over worker processes.
+
+        Only the imports of the API routes are used, so the other extractors are skipped for them.
+        """
+        api_route_paths = {file.relative_file_path for file in api_route_files}
+        contents_by_path = {
+            file.relative_file_path: file.content
+            for file in files
+            if file.content and file.relative_file_path not in api_route_paths
+        }
+        api_route_contents_by_path = {
+            file.relative_file_path: file.content
+            for file in api_route_files
+            if file.content
+        }
+        start_time = time.perf_counter()
+        self.content_analysis_by_path = {
+            **dict(
+                zip(
+                    contents_by_path,
+                    analyze_contents(list(contents_by_path.values())),
+                    strict=True,
+                )
+            ),
+            **dict(
+                zip(
+                    api_route_contents_by_path,
+                    analyze_contents(
+                        list(api_route_contents_by_path.values()),
+                        analyze=analyze_api_route_content,
+                    ),
+                    strict=True,
+                )
+            ),
+        }
+        logger.info(
+            "Analyzed {} files in {:.2f}s",
+            len(self.content_analysis_by_path),
+            time.perf_counter() - start_time,
+        )
+
     def process_app_router_file(self, file: FileInfo) -> None:
         """Process the app router file for the NextJs analyzer."""
         if not file.content:
@@ -515,21 +853,12 @@ class NextjsAnalyzer:
         )
 
         # Simplified extraction methods that would use regex patterns
-        file_detail.details["imports"] = self._extract_imports_from_content(
-            file.content
-        )
-        file_detail.details["exports"] = self._extract_exports_from_content(
-            file.content
-        )
-        file_detail.details["hooks"] = self._extract_hooks_from_content(file.content)
-        file_detail.details["eventHandlers"] = (
-            self._extract_event_handlers_from_content(file.content)
-        )
-        file_detail.details["components"] = self._extract_components_from_content(
-            file.content
+        file_detail.details.update(
+            self.content_analysis_by_path.get(file.relative_file_path)
+            or analyze_content(file.content)
         )
 
-        if file.name in ["page.js", "page.tsx"]:
+        if file.name in APP_PAGE_FILE_NAMES:
             file_detail.details["isRoute"] = True
             route_path = self.get_route_path_from_file_app(file.relative_file_path)
             self.routes.append(route_path)
@@ -537,15 +866,15 @@ class NextjsAnalyzer:
                 route_path=route_path,
                 relative_file_path=file.relative_file_path,
                 components=file_detail.details["components"] or [],
-                has_params=self.has_route_params(route_path),
-                has_form_submission=self.has_form_submission_in_content(file.content),
+                has_params=":" in route_path,
+                has_form_submission=has_form_submission(file.content),
             )
             self.pages.append(page_info)
             file_detail.details["pageInfo"] = page_info.__dict__
-        elif file.name in ["layout.js", "layout.tsx"]:
+        elif file.name in APP_LAYOUT_FILE_NAMES:
             file_detail.details["isLayout"] = True
             layout_name = None
-            exports = self._extract_exports_from_content(file.content)
+            exports = file_detail.details["exports"]
             default_export = next((e for e in exports if "(default)" in e), None)
 
             if default_export:
@@ -562,23 +891,22 @@ class NextjsAnalyzer:
 
             if file.relative_file_path in ["app/layout.tsx", "app/layout.js"]:
                 layout_name = "RootLayout"
-        elif (
-            file.name in ["route.js", "route.tsx"] or "/api/" in file.relative_file_path
-        ):
+        elif is_app_api_route_file(file):
             file_detail.details["isApiRoute"] = True
             route_path = self.get_route_path_from_file_app(file.relative_file_path)
             self.api_routes.append(route_path)
             api_info = ApiInfo(
                 route_path=route_path,
                 relative_file_path=file.relative_file_path,
-                methods=self._extract_api_methods_from_content(file.content),
-                input_validation=self.has_input_validation_in_content(file.content),
+                methods=extract_api_methods(file.content),
+                input_validation=has_input_validation(file.content),
                 dependencies=file_detail.details["imports"] or [],
             )
             self.apis.append(api_info)
             file_detail.details["apiInfo"] = api_info.__dict__
 
         self.results.append(file_detail)
+        self.results_by_path[file.relative_file_path] = file_detail
 
     def process_pages_router_file(self, file: FileInfo) -> None:
         """Process the pages router file for the NextJs analyzer."""
@@ -598,18 +926,9 @@ class NextjsAnalyzer:
                 "eventHandlers": [],
             },
         )
-        file_detail.details["imports"] = self._extract_imports_from_content(
-            file.content
-        )
-        file_detail.details["exports"] = self._extract_exports_from_content(
-            file.content
-        )
-        file_detail.details["hooks"] = self._extract_hooks_from_content(file.content)
-        file_detail.details["eventHandlers"] = (
-            self._extract_event_handlers_from_content(file.content)
-        )
-        file_detail.details["components"] = self._extract_components_from_content(
-            file.content
+        file_detail.details.update(
+            self.content_analysis_by_path.get(file.relative_file_path)
+            or analyze_content(file.content)
         )
 
         # Check for _app.js/_app.tsx which could be considered a layout
@@ -619,18 +938,18 @@ class NextjsAnalyzer:
                 relative_file_path=file.relative_file_path,
                 relative_dir_path=file.relative_dir_path,
                 content=file.content or "",
-                components=self._extract_components_from_content(file.content or ""),
+                components=file_detail.details["components"],
             )
 
-        if file.relative_file_path.startswith("pages/api/"):
+        if is_pages_api_route_file(file):
             file_detail.details["isApiRoute"] = True
             route_path = self.get_route_path_from_file_pages(file.relative_file_path)
             self.api_routes.append(route_path)
             api_info = ApiInfo(
                 route_path=route_path,
                 relative_file_path=file.relative_file_path,
-                methods=self._extract_api_methods_from_content(file.content),
-                input_validation=self.has_input_validation_in_content(file.content),
+                methods=extract_api_methods(file.content),
+                input_validation=has_input_validation(file.content),
                 dependencies=file_detail.details["imports"] or [],
             )
             self.apis.append(api_info)
@@ -643,143 +962,42 @@ class NextjsAnalyzer:
                 route_path=route_path,
                 relative_file_path=file.relative_file_path,
                 components=file_detail.details["components"] or [],
-                has_params=self.has_route_params(route_path),
-                has_form_submission=self.has_form_submission_in_content(file.content),
+                has_params=":" in route_path,
+                has_form_submission=has_form_submission(file.content),
             )
             self.pages.append(page_info)
             file_detail.details["pageInfo"] = page_info.__dict__
 
         self.results.append(file_detail)
-
-    def _extract_imports_from_content(self, content: str) -> List[str]:
-        """Extract the imports from the content."""
-        # Simplified import extraction using regex
-        imports = []
-
-        for match in re.finditer(r"import\s+(?:{([^}]+)}|([^{}\s;]+))\s+from", content):
-            if match.group(1):  # Named imports
-                for name in re.findall(r"(\w+)", match.group(1)):
-                    imports.append(name)
-            elif match.group(2):  # Default import
-                imports.append(match.group(2))
-
-        return imports
-
-    def _extract_exports_from_content(self, content: str) -> List[str]:
-        """Extract the exports from the content."""
-        # Simplified export extraction using regex
-        exports = []
-
-        # Named exports
-        for match in re.finditer(r"export\s+(const|let|var|function)\s+(\w+)", content):
-            exports.append(match.group(2))
-
-        # Default exports
-        for match in re.finditer(r"export\s+default\s+(?:function\s+)?(\w+)", content):
-            exports.append(f"{match.group(1)} (default)")
-
-        # Default exports of variables/consts
-        for match in re.finditer(r"export\s+default\s+(\w+)", content):
-            if match.group(1) not in [
-                exp.split()[0] for exp in exports if "(default)" in exp
-            ]:
-                exports.append(f"{match.group(1)} (default)")
-
-        if not any("default" in exp for exp in exports) and "export default" in content:
-            exports.append("(anonymous default export)")
-
-        return exports
-
-    def _extract_hooks_from_content(self, content: str) -> List[str]:
-        # Find React hooks (functions starting with "use" followed by uppercase)
-        hooks = []
-        for match in re.finditer(r"\b(use[A-Z]\w*)\s*\(", content):
-            hook = match.group(1)
-            if hook not in hooks:
-                hooks.append(hook)
-        return hooks
-
-    def _extract_event_handlers_from_content(self, content: str) -> List[str]:
-        """Extract the event handlers from the content."""
-        # Find event handlers based on naming patterns
-        handlers = []
-
-        # Function declarations
-        for match in re.finditer(
-            r"(?:function|const|let|var)\s+((handle|on)[A-Z]\w*|\w+(Click|Change|Submit|Focus|Blur))",
-            content,
-        ):
-            handler = match.group(1)
-            if handler not in handlers:
-                handlers.append(handler)
-
-        return handlers
-
-    def has_form_submission_in_content(self, content: str) -> bool:
-        """Check if the content has a form submission."""
-        # Check for form elements or onSubmit handlers
-        return bool(
-            re.search(r"<form", content)
-            or re.search(r"onSubmit", content)
-            or re.search(r"handleSubmit", content)
-        )
-
-    def _extract_api_methods_from_content(self, content: str) -> List[str]:
-        """Extract the API methods from the content."""
-        # Extract HTTP methods from API route handlers
-        methods = []
-
-        # Look for req.method references
-        for method in ["GET", "POST", "PUT", "DELETE", "PATCH"]:
-            if re.search(
-                rf"req\.method\s*===?\s*['\"]({method})['\"]", content, re.IGNORECASE
-            ):
-                methods.append(method)
-
-        # Look for specific method handlers or express-like route handlers
-        for method in ["get", "post", "put", "delete", "patch"]:
-            if re.search(rf"\b{method}\s*\(", content, re.IGNORECASE):
-                methods.append(method.upper())
-
-        return list(set(methods))
-
-    def has_input_validation_in_content(self, content: str) -> bool:
-        """Check if the content has input validation."""
-        # Check for common validation libraries or patterns
-        validation_patterns = [
-            r"\bvalidate\b",
-            r"\bschema\b",
-            r"\byup\b",
-            r"\bzod\b",
-            r"\bjoi\b",
-        ]
-        return any(re.search(pattern, content) for pattern in validation_patterns)
-
-    def has_route_params(self, route: str) -> bool:
-        """Check if the route has route params."""
-        return ":" in route
+        self.results_by_path[file.relative_file_path] = file_detail
 
     def get_route_path_from_file_app(self, file_path: str) -> str:
         """Get the route path from the file path."""
         # Transform app/dashboard/settings/page.tsx -> /dashboard/settings
-        route_path = re.sub(r"^app", "", file_path)
-        route_path = re.sub(r"/(page|route|layout)\.(js|jsx|ts|tsx)$", "", route_path)
+        route_path = file_path.removeprefix("app")
+
+        if route_path.endswith(APP_ROUTE_FILE_SUFFIXES):
+            route_path = route_path[: route_path.rindex("/")]
 
         # Handle dynamic route params
-        route_path = re.sub(r"/\[([^\]]+)\]", r"/:\1", route_path)
+        if "[" in route_path:
+            route_path = DYNAMIC_SEGMENT_RE.sub(r"/:\1", route_path)
 
         return route_path or "/"
 
     def get_route_path_from_file_pages(self, file_path: str) -> str:
         """Get the route path from the file path."""
         # Transform pages/dashboard/settings.tsx -> /dashboard/settings
-        route_path = re.sub(r"^pages", "", file_path)
-        route_path = re.sub(r"\.(js|jsx|ts|tsx)$", "", route_path)
+        route_path = file_path.removeprefix("pages")
+
+        if route_path.endswith(PARSED_FILE_EXTENSIONS):
+            route_path = route_path[: route_path.rindex(".")]
 
         # Handle dynamic route params
-        route_path = re.sub(r"/\[([^\]]+)\]", r"/:\1", route_path)
+        if "[" in route_path:
+            route_path = DYNAMIC_SEGMENT_RE.sub(r"/:\1", route_path)
 
         # Handle index routes
-        route_path = re.sub(r"/index$", "", route_path)
+        route_path = route_path.removesuffix("/index")
 
         return route_path or "/"
@@ -1,27 +1,73 @@
-import glob
+import fnmatch
 import os
-from typing import Dict, List, Literal, Optional, TypedDict, Union
+import re
+from typing import Dict, Iterator, List, Literal, Optional, TypedDict, Union
 
 from loguru import logger
 
-from bugster.libs.utils.files import filter_path
+from bugster.constants import IGNORE_PATTERNS
+from bugster.libs.utils.files import is_ignored_path, matches_gitignore
 
+# Ignore patterns ending in `**` exclude everything below a matching directory, so such directories are pruned
+# from the walk instead of being listed and filtered file by file
+DIRECTORY_IGNORE_PATTERNS = [
+    pattern for pattern in IGNORE_PATTERNS if pattern.endswith("**")
+]
+DIRECTORY_IGNORE_PATTERNS_RE = re.compile(
+    "|".join(
+        fnmatch.translate(os.path.normcase(pattern))
+        for pattern in DIRECTORY_IGNORE_PATTERNS
+    )
+)
+SOURCE_FILE_EXTENSIONS = (".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs")
+# Sorted source paths of the walked directories with the `.gitignore` rules they were filtered with
+_source_paths_cache: Dict[str, tuple] = {}
 
-def filter_paths(all_paths: List[str], allowed_extensions: Optional[list[str]] = None):
-    """Filter paths based on ignore patterns and `.gitignore` rules."""
-    filtered_paths = []
 
-    if allowed_extensions is None:
-        allowed_extensions = [".ts", ".tsx", ".js", ".jsx"]
+def is_ignored_directory(dir_path: str, gitignore=None) -> bool:
+    """Check if everything below a relative directory path is excluded by the ignore patterns or `.gitignore`."""
+    dir_path = f"{dir_path}/"
+
+    if DIRECTORY_IGNORE_PATTERNS_RE.match(os.path.normcase(dir_path)):
+        return True
+
+    return bool(gitignore and matches_gitignore(dir_path, gitignore))
+
+
+def walk_files(dir_path: str, gitignore=None) -> Iterator[str]:
+    """Yield the `/`-separated relative paths of the regular files below a directory.
 
-    for path in all_paths:
-        filtered_path = filter_path(path=path, allowed_extensions=allowed_extensions)
+    Hidden entries are skipped, and ignored directories are pruned without being scanned.
+    """
+    # A negated `.gitignore` rule can re-include files below an ignored directory, so gitignored directories
+    # are only pruned when there are none
+    if gitignore and any(pattern.include is False for pattern in gitignore.patterns):
+        gitignore = None
 
-        if filtered_path:
-            filtered_paths.append(filtered_path)
+    stack = [("", dir_path)]
 
-    filtered_paths.sort()
-    return filtered_paths
+    while stack:
+        relative_dir_path, absolute_dir_path = stack.pop()
+
+        try:
+            entries = os.scandir(absolute_dir_path)
+        except OSError as error:
+            logger.error("Failed to scan directory {}: {}", absolute_dir_path, error)
+            continue
+
+        with entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+
+                relative_path = f"{relative_dir_path}{entry.name}"
+
+                if entry.is_dir():
+                    if not is_ignored_directory(relative_path, gitignore=gitignore):
+                        stack.append((f"{relative_path}/", entry.path))
+                elif entry.is_file():
+                    # Broken symlinks, sockets or FIFOs can't be read as sources
+                    yield relative_path
 
 
 def get_paths(
@@ -29,11 +75,51 @@ def get_paths(
 ) -> List[str]:
     """Get all file paths in a directory, excluding test files and specific directories, while respecting
     `.gitignore` rules."""
-    original_dir = os.getcwd()
-    os.chdir(dir_path)
-    all_paths = glob.glob("**/*", recursive=True)
-    paths = filter_paths(all_paths=all_paths, allowed_extensions=allowed_extensions)
-    os.chdir(original_dir)
+    from bugster.libs.utils.git import get_gitignore
+
+    if allowed_extensions is None:
+        allowed_extensions = [".ts", ".tsx", ".js", ".jsx"]
+
+    extensions = tuple(allowed_extensions)
+    gitignore = get_gitignore()
+
+    if set(extensions) <= set(SOURCE_FILE_EXTENSIONS):
+        return [
+            path
+            for path in get_source_paths(dir_path=dir_path, gitignore=gitignore)
+            if path.endswith(extensions)
+        ]
+
+    paths = [
+        path
+        for path in walk_files(dir_path=dir_path, gitignore=gitignore)
+        if path.endswith(extensions)
+        and not is_ignored_path(path=path, gitignore=gitignore)
+    ]
+    paths.sort()
+    return paths
+
+
+def get_source_paths(dir_path: str, gitignore=None) -> List[str]:
+    """Get the sorted JS/TS source file paths in a directory, walking it once per run.
+
+    The framework detection and the analysis both list the sources of the same directory when the app is at
+    the project root, so the walk is reused as long as the `.gitignore` rules are the same.
+    """
+    cache_key = os.path.abspath(dir_path)
+    cached = _source_paths_cache.get(cache_key)
+
+    if cached and cached[0] is gitignore:
+        return cached[1]
+
+    paths = [
+        path
+        for path in walk_files(dir_path=dir_path, gitignore=gitignore)
+        if path.endswith(SOURCE_FILE_EXTENSIONS)
+        and not is_ignored_path(path=path, gitignore=gitignore)
+    ]
+    paths.sort()
+    _source_paths_cache[cache_key] = (gitignore, paths)
     return paths
 
 
@@ -54,60 +140,57 @@ class DirectoryNode(TypedDict):
 TreeNode = Union[DirectoryNode, FileNode]
 
 
-def get_tree_structure(source_dir) -> TreeNode:
-    """Get the tree structure of the source directory."""
+def build_tree_from_paths(root_name: str, paths: List[str]) -> TreeNode:
+    """Build the tree structure of a directory from the sorted relative paths of its files."""
     logger.info("Building application structure tree...")
-    paths = get_paths(source_dir)
     root_node: DirectoryNode = {
         "path": "",
-        "name": os.path.basename(source_dir),
+        "name": root_name,
         "type": "directory",
         "children": [],
     }
-    dir_map: Dict[str, DirectoryNode] = {}
-    dir_map[""] = root_node
-
-    def ensure_directory_path(dir_path: str) -> DirectoryNode:
-        """Helper function to ensure a directory path exists in the tree and returns the node for that
-        directory."""
-        if dir_path in dir_map:
-            return dir_map[dir_path]
-
-        parent_path = os.path.dirname(dir_path)
-        parent_node = (
-            root_node if parent_path == "." else ensure_directory_path(parent_path)
-        )
-        dir_name = os.path.basename(dir_path)
-        dir_node: DirectoryNode = {
-            "path": dir_path,
-            "name": dir_name,
-            "type": "directory",
-            "children": [],
-        }
-        parent_node["children"].append(dir_node)
-        dir_map[dir_path] = dir_node
-        return dir_node
+    # The paths are sorted, so everything below a directory is contiguous and the directories being filled form
+    # a stack going down from the root
+    open_dir_nodes: List[DirectoryNode] = [root_node]
 
     for file_path in paths:
         if not file_path:
             continue
 
-        is_directory = not os.path.splitext(file_path)[1]
-
-        if is_directory:
-            ensure_directory_path(file_path)
-        else:
-            dir_path = os.path.dirname(file_path)
-            parent_node = (
-                root_node if dir_path == "." else ensure_directory_path(dir_path)
-            )
-            file_name = os.path.basename(file_path)
-            file_node: FileNode = {
-                "path": file_path,
-                "name": file_name,
-                "type": "file",
-                "extension": os.path.splitext(file_path)[1],
-            }
-            parent_node["children"].append(file_node)
+        dir_path = os.path.dirname(file_path)
+
+        # Close the directories the path is not below
+        while open_dir_nodes[-1]["path"] and not (
+            dir_path == open_dir_nodes[-1]["path"]
+            or dir_path.startswith(f"{open_dir_nodes[-1]['path']}/")
+        ):
+            open_dir_nodes.pop()
+
+        # Open the missing directories down to the one of the path
+        parent_path = open_dir_nodes[-1]["path"]
+
+        if dir_path != parent_path:
+            missing_dir_names = dir_path[len(parent_path) + 1 if parent_path else 0 :]
+
+            for dir_name in missing_dir_names.split("/"):
+                parent_node = open_dir_nodes[-1]
+                dir_node: DirectoryNode = {
+                    "path": f"{parent_node['path']}/{dir_name}"
+                    if parent_node["path"]
+                    else dir_name,
+                    "name": dir_name,
+                    "type": "directory",
+                    "children": [],
+                }
+                parent_node["children"].append(dir_node)
+                open_dir_nodes.append(dir_node)
+
+        file_node: FileNode = {
+            "path": file_path,
+            "name": os.path.basename(file_path),
+            "type": "file",
+            "extension": os.path.splitext(file_path)[1],
+        }
+        open_dir_nodes[-1]["children"].append(file_node)
 
     return root_node
@@ -1,7 +1,7 @@
-import json
 import os
 import re
 import time
+from functools import lru_cache
 
 from loguru import logger
 
@@ -9,17 +9,28 @@ from bugster.analyzer.core.app_analyzer.utils.get_tree_structure import get_path
 from bugster.analyzer.utils.errors import BugsterError
 from bugster.analyzer.utils.get_git_info import get_git_info
 from bugster.constants import BUGSTER_DIR
+from bugster.utils import json_io
 
 PROJECT_JSON_PATH = os.path.join(BUGSTER_DIR, "project.json")
 
 
+@lru_cache(maxsize=1)
+def _load_project_info(project_json_path: str, mtime_ns: int, size: int):
+    """Parse a `project.json` file, memoized on its path, modification time and size.
+
+    The parsed project info is shared between the callers, so it must not be mutated.
+    """
+    with open(project_json_path, "rb") as f:
+        return json_io.loads(f.read())
+
+
 def get_project_info():
     """Get the project info."""
     logger.info("Getting project info...")
 
     try:
-        with open(PROJECT_JSON_PATH, encoding="utf-8") as f:
-            return json.load(f)
+        stat = os.stat(PROJECT_JSON_PATH)
+        return _load_project_info(PROJECT_JSON_PATH, stat.st_mtime_ns, stat.st_size)
     except Exception as error:
         logger.error("Failed to read cached project data: {}", error)
         raise BugsterError(
@@ -62,8 +73,8 @@ def detect_framework(options={}):
 
     if not options.get("force") and os.path.exists(PROJECT_JSON_PATH):
         try:
-            with open(PROJECT_JSON_PATH, encoding="utf-8") as f:
-                project_info = json.load(f)
+            with open(PROJECT_JSON_PATH, "rb") as f:
+                project_info = json_io.loads(f.read())
 
             return project_info
         except Exception as error:
@@ -97,8 +108,8 @@ def detect_framework(options={}):
             },
         }
 
-        with open(PROJECT_JSON_PATH, "w", encoding="utf-8") as f:
-            json.dump(project_info, f, indent=2)
+        with open(PROJECT_JSON_PATH, "wb") as f:
+            json_io.dump(project_info, f)
 
         logger.info("Saved project information to {}", PROJECT_JSON_PATH)
         return project_info
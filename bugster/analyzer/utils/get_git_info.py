@@ -1,6 +1,7 @@
+import os
 from dataclasses import dataclass
+from functools import lru_cache
 
-from git import InvalidGitRepositoryError, Repo
 from loguru import logger
 
 
@@ -19,13 +20,23 @@ class GitInfo:
         }
 
 
-def get_git_info() -> GitInfo:
-    """Get Git repository information."""
+@lru_cache(maxsize=8)
+def _load_git_info(dir_path: str) -> GitInfo:
+    """Load the Git repository information of a directory, cached for the rest of the run."""
+    # GitPython is slow to import, commands that never record git info shouldn't pay for it
+    from git import InvalidGitRepositoryError, Repo
+
     try:
-        repo = Repo(search_parent_directories=True)
+        repo = Repo(dir_path, search_parent_directories=True)
         branch = repo.active_branch.name
         commit = repo.head.commit.hexsha
-        return GitInfo(branch=branch, commit=commit).to_dict()
+        return GitInfo(branch=branch, commit=commit)
     except (InvalidGitRepositoryError, Exception) as error:
         logger.error("Failed to get git info {}", error)
-        return GitInfo(branch=None, commit=None).to_dict()
+        return GitInfo(branch=None, commit=None)
+
+
+def get_git_info() -> GitInfo:
+    """Get Git repository information."""
+    # The framework detection and the analysis both record it, the repository is only opened once per run
+    return _load_git_info(os.getcwd()).to_dict()
@@ -1,9 +1,9 @@
 """Command-line interface for Bugster."""
 
+import multiprocessing
 from typing import Optional
 
 from click import Choice
-from loguru import logger
 from rich.console import Console
 from typer import Argument, BadParameter, Exit, Option, Typer
 
@@ -40,6 +40,8 @@ def configure_logging(debug: bool):
     """Configure loguru logging based on debug flag."""
     import sys
 
+    from loguru import logger
+
     # Remove all existing handlers
     logger.remove()
 
@@ -97,15 +99,9 @@ def main_callback(
     ),
 ):
     """🐛 Bugster CLI - AI-powered end-to-end testing for web applications"""
-    import atexit
-
-    from bugster.analytics import get_analytics
-
     global _debug_enabled
     _debug_enabled = debug
     configure_logging(debug)
-    analytics = get_analytics()
-    atexit.register(analytics.flush)
 
 
 @app.command()
@@ -483,4 +479,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # The frozen binary re-executes itself for the analyzer worker processes
+    multiprocessing.freeze_support()
     main()
@@ -11,7 +11,7 @@ from rich.console import Console
 
 from bugster.analytics import track_command
 from bugster.constants import CONFIG_PATH
-from bugster.utils.file import load_config
+from bugster.utils.file import load_config, write_file_atomic
 
 console = Console()
 
@@ -133,8 +133,7 @@ def config_command(bypass_protection: Optional[bool] = None):
         updated_content = update_vercel_bypass_secret_in_config(config_content, secret_to_save)
 
         # Write the updated content back
-        with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-            f.write(updated_content)
+        write_file_atomic(CONFIG_PATH, updated_content, mode=0o600)
 
         console.print(
             "\n[green]✓ Vercel protection bypass secret has been saved to config.yaml[/green]"
@@ -18,10 +18,35 @@ from bugster.constants import (
 )
 from bugster.libs.utils.git import get_git_prefix_path
 from bugster.utils.console_messages import InitMessages
+from bugster.utils.file import write_file_atomic
 from bugster.utils.user_config import get_api_key
 
 console = Console()
 
+# Static, commented-out test execution preferences appended to every config.yaml
+CONFIG_PREFERENCES_TEMPLATE = "\n".join(
+    [
+        "",
+        "",
+        "# Test Execution Preferences",
+        "# Uncomment and modify the options below to customize test execution behavior.",
+        "# CLI options will override these settings when specified.",
+        "# preferences:",
+        "#   tests:",
+        "#     always_run:",
+        "#       - .bugster/tests/test1.yaml",
+        "#       - .bugster/tests/test2.yaml",
+        "#     limit: 5                    # Maximum number of tests to run",
+        "#     headless: false             # Run tests in headless mode",
+        "#     silent: false               # Run tests in silent mode",
+        "#     verbose: false              # Enable verbose output",
+        "#     only_affected: false        # Only run tests for affected files",
+        "#     parallel: 5                 # Maximum number of concurrent tests",
+        "#     output: bugster_output.json # Save test results to JSON file",
+        "",
+    ]
+)
+
 
 def create_credential_entry(
     identifier="admin",
@@ -157,29 +182,7 @@ def generate_config_yaml_with_template(
         else:
             config_lines.append("# x-railway-protection-bypass: your-bypass-secret")
 
-    config_lines.extend(
-        [
-            "",
-            "",
-            "# Test Execution Preferences",
-            "# Uncomment and modify the options below to customize test execution behavior.",
-            "# CLI options will override these settings when specified.",
-            "# preferences:",
-            "#   tests:",
-            "#     always_run:",
-            "#       - .bugster/tests/test1.yaml",
-            "#       - .bugster/tests/test2.yaml",
-            "#     limit: 5                    # Maximum number of tests to run",
-            "#     headless: false             # Run tests in headless mode",
-            "#     silent: false               # Run tests in silent mode",
-            "#     verbose: false              # Enable verbose output",
-            "#     only_affected: false        # Only run tests for affected files",
-            "#     parallel: 5                 # Maximum number of concurrent tests",
-            "#     output: bugster_output.json # Save test results to JSON file",
-            "",
-        ]
-    )
-
+    config_lines.append(CONFIG_PREFERENCES_TEMPLATE)
     return "\n".join(config_lines)
 
 
@@ -391,8 +394,8 @@ def init_command(
         platform=platform,
     )
 
-    with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-        f.write(config_content)
+    # The config holds login credentials, so keep it readable by the owner only
+    write_file_atomic(CONFIG_PATH, config_content, mode=0o600)
 
     # Show success message and summary
     InitMessages.initialization_success()
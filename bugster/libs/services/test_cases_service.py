@@ -4,7 +4,6 @@ from collections import OrderedDict
 from random import randint
 from typing import Any, List, Optional
 
-import yaml
 from loguru import logger
 from rich.console import Console
 from rich.status import Status
@@ -17,19 +16,13 @@ from bugster.libs.utils.errors import BugsterError
 from bugster.libs.utils.files import get_specs_pages, get_specs_paths
 from bugster.libs.utils.llm import format_tests_for_llm
 from bugster.libs.utils.nextjs.extract_page_folder import extract_page_folder
+from bugster.utils import json_io
 from bugster.utils.user_config import get_api_key
+from bugster.utils.yaml_io import safe_dump
 
 console = Console()
 
 
-def _ordered_dict_representer(dumper: yaml.Dumper, data: OrderedDict):
-    """Custom representer for OrderedDict to maintain field order in YAML."""
-    return dumper.represent_mapping("tag:yaml.org,2002:map", data.items())
-
-
-yaml.add_representer(OrderedDict, _ordered_dict_representer)
-
-
 def has_yaml_test_cases() -> bool:
     """Check if there are any YAML test case files in the TESTS_DIR."""
     if not TESTS_DIR.exists():
@@ -55,9 +48,15 @@ def get_or_create_folder(folder_name: str) -> str:
     return folder_path
 
 
+# Spaces and path separators become underscores; characters invalid in file names are dropped
+_NAME_TRANSLATION = str.maketrans(
+    {" ": "_", "/": "_", "\\": "_", **dict.fromkeys('<>:"|?*')}
+)
+
+
 def normalize_name(name: str) -> str:
     """Normalize a name to a valid name."""
-    return name.lower().replace(" ", "_")
+    return name.translate(_NAME_TRANSLATION).lower()
 
 
 class TestCasesService:
@@ -126,32 +125,24 @@ class TestCasesService:
         if count is not None:
             data["count"] = count
 
-        with open(self.analysis_json_path, encoding="utf-8") as file:
-            analysis_data = yaml.safe_load(file)
-            payload = {"json": analysis_data, "data": data}
+        with open(self.analysis_json_path, "rb") as file:
+            analysis_data = json_io.loads(file.read())
 
-            with BugsterHTTPClient() as client:
-                api_key = get_api_key()
+        payload = {"json": analysis_data, "data": data}
 
-                if api_key:
-                    client.set_headers({"x-api-key": api_key})
-
-                return client.post(
-                    endpoint=BugsterApiPath.GENERATE_INIT.value,
-                    json=payload,
-                )
+        with BugsterHTTPClient() as client:
+            api_key = get_api_key()
 
-    def _save_test_case_as_yaml(self, test_case: dict[Any, str]):
-        """Save test case as a YAML file.
+            if api_key:
+                client.set_headers({"x-api-key": api_key})
 
-        :param test_case: The test case to save. V.g., `{"name": "Test Case 1", "page": "Home", "page_path": "/",
-            "task": "Test Case 1", "steps": ["Step 1", "Step 2"], "expected_result": "Expected Result"}`
-        :return: The path to the saved test case file. V.g., `tests/<page>/<spec>.yaml`
-        """
-        folder_name = extract_page_folder(file_path=test_case["page_path"])
-        folder_path = get_or_create_folder(folder_name=folder_name)
-        file_name = normalize_name(name=test_case["name"])
+            return client.post(
+                endpoint=BugsterApiPath.GENERATE_INIT.value,
+                json=payload,
+            )
 
+    def _get_next_spec_index(self, folder_name: str, folder_path: str) -> int:
+        """Get the next numeric prefix for a spec file saved in a page folder."""
         try:
             specs_paths = get_specs_paths(
                 relatives_to=folder_path, folder_name=folder_name
@@ -163,13 +154,18 @@ class TestCasesService:
 
             if specs_paths and has_numeric_prefix:
                 sorted_paths = sorted(specs_paths, key=lambda x: int(x.split("_")[0]))
-                index = int(sorted_paths[-1].split("_")[0]) + 1
-            else:
-                index = 1
+                return int(sorted_paths[-1].split("_")[0]) + 1
+
+            return 1
         except Exception as err:
             logger.error("Error getting specs paths: {}", err)
-            index = randint(1, 1000000)
+            return randint(1, 1000000)
 
+    def _write_test_case_yaml(
+        self, test_case: dict[Any, str], folder_path: str, index: int
+    ) -> str:
+        """Write a test case to `<folder_path>/<index>_<name>.yaml` and return the file path."""
+        file_name = normalize_name(name=test_case["name"])
         file_name = f"{index}_{file_name}.yaml"
         file_path = os.path.join(folder_path, file_name)
 
@@ -187,11 +183,57 @@ class TestCasesService:
                 ordered_test_case[key] = value
 
         with open(file_path, "w", encoding="utf-8") as f:
-            yaml.dump(ordered_test_case, f, default_flow_style=False, sort_keys=False)
+            safe_dump(ordered_test_case, f, default_flow_style=False, sort_keys=False)
 
         logger.info("Saved test case to {}", file_path)
         return file_path
 
+    def _save_test_case_as_yaml(self, test_case: dict[Any, str]):
+        """Save test case as a YAML file.
+
+        :param test_case: The test case to save. V.g., `{"name": "Test Case 1", "page": "Home", "page_path": "/",
+            "task": "Test Case 1", "steps": ["Step 1", "Step 2"], "expected_result": "Expected Result"}`
+        :return: The path to the saved test case file. V.g., `tests/<page>/<spec>.yaml`
+        """
+        folder_name = extract_page_folder(file_path=test_case["page_path"])
+        folder_path = get_or_create_folder(folder_name=folder_name)
+        index = self._get_next_spec_index(
+            folder_name=folder_name, folder_path=folder_path
+        )
+        return self._write_test_case_yaml(
+            test_case=test_case, folder_path=folder_path, index=index
+        )
+
+    def _save_test_cases_as_yaml(self, test_cases: list[dict[Any, str]]) -> list[str]:
+        """Save several test cases as YAML files.
+
+        Test cases are grouped by page folder so each folder is created and scanned for its next spec index only
+        once, instead of once per test case.
+
+        :param test_cases: The test cases to save, see `_save_test_case_as_yaml`.
+        :return: The paths to the saved test case files, in the same order as `test_cases`.
+        """
+        cases_by_folder: dict[str, list[tuple[int, dict[Any, str]]]] = {}
+
+        for position, test_case in enumerate(test_cases):
+            folder_name = extract_page_folder(file_path=test_case["page_path"])
+            cases_by_folder.setdefault(folder_name, []).append((position, test_case))
+
+        file_paths = [None] * len(test_cases)
+
+        for folder_name, folder_cases in cases_by_folder.items():
+            folder_path = get_or_create_folder(folder_name=folder_name)
+            index = self._get_next_spec_index(
+                folder_name=folder_name, folder_path=folder_path
+            )
+
+            for offset, (position, test_case) in enumerate(folder_cases):
+                file_paths[position] = self._write_test_case_yaml(
+                    test_case=test_case, folder_path=folder_path, index=index + offset
+                )
+
+        return file_paths
+
     def _check_results(self, job_id: str) -> str:
         """Get the status of a job."""
         with BugsterHTTPClient() as client:
@@ -275,8 +317,7 @@ class TestCasesService:
         except Exception as err:
             logger.error("Error updating onboarding status: {}", err)
 
-        for test_case in test_cases:
-            self._save_test_case_as_yaml(test_case=test_case)
+        self._save_test_cases_as_yaml(test_cases=test_cases)
 
         logger.info("Test cases saved successfully")
 
@@ -310,7 +351,7 @@ class TestCasesService:
                 ordered_spec_data[key] = value
 
         with open(path, "w", encoding="utf-8") as f:
-            yaml.dump(ordered_spec_data, f, default_flow_style=False, sort_keys=False)
+            safe_dump(ordered_spec_data, f, default_flow_style=False, sort_keys=False)
 
     def update_spec_by_diff(
         self,
@@ -1,11 +1,25 @@
 import fnmatch
 import os
+import re
 from typing import Callable, Optional
 
-import yaml
 from loguru import logger
+from pathspec import PathSpec
+from pathspec.util import normalize_file
 
 from bugster.constants import IGNORE_PATTERNS, TESTS_DIR
+from bugster.utils.yaml_io import safe_load
+
+# The ignore patterns are matched as a single regex instead of one `fnmatch` call per pattern
+IGNORE_PATTERNS_RE = re.compile(
+    "|".join(
+        fnmatch.translate(os.path.normcase(pattern)) for pattern in IGNORE_PATTERNS
+    )
+)
+# Named groups can't be repeated across the alternatives of a regex
+NAMED_GROUP_RE = re.compile(r"\(\?P<\w+>")
+# Combined regex of the last `.gitignore` rules matched against, by the id of the rules it was built from
+_gitignore_regex_cache: dict[int, tuple[PathSpec, Optional[re.Pattern]]] = {}
 
 
 def get_specs_paths(
@@ -43,7 +57,7 @@ def get_specs_pages(parser: Callable = parse_spec_page) -> dict[str, list[dict]]
     for spec_path in specs_paths:
         with open(spec_path, encoding="utf-8") as file:
             try:
-                data = yaml.safe_load(file)
+                data = safe_load(file)
 
                 if isinstance(data, list):
                     if not data:
@@ -70,6 +84,61 @@ def get_specs_pages(parser: Callable = parse_spec_page) -> dict[str, list[dict]]
     return specs_pages
 
 
+def get_gitignore_regex(gitignore) -> Optional[re.Pattern]:
+    """Combine the `.gitignore` rules into a single regex, or return `None` if they can't be.
+
+    Without negated rules a path is ignored as soon as any rule matches it, so the rules can be matched as one
+    alternation instead of one regex per rule.
+    """
+    cached = _gitignore_regex_cache.get(id(gitignore))
+
+    if cached and cached[0] is gitignore:
+        return cached[1]
+
+    patterns = [
+        pattern for pattern in gitignore.patterns if pattern.include is not None
+    ]
+    gitignore_regex = None
+
+    if (
+        all(
+            pattern.include and getattr(pattern, "regex", None) is not None
+            for pattern in patterns
+        )
+        and len({pattern.regex.flags for pattern in patterns}) <= 1
+    ):
+        gitignore_regex = re.compile(
+            "|".join(
+                f"(?:{NAMED_GROUP_RE.sub('(?:', pattern.regex.pattern)})"
+                for pattern in patterns
+            )
+            or "(?!)",
+            patterns[0].regex.flags if patterns else 0,
+        )
+
+    _gitignore_regex_cache.clear()
+    _gitignore_regex_cache[id(gitignore)] = (gitignore, gitignore_regex)
+    return gitignore_regex
+
+
+def matches_gitignore(path: str, gitignore) -> bool:
+    """Check if a relative path matches the `.gitignore` rules."""
+    gitignore_regex = get_gitignore_regex(gitignore)
+
+    if gitignore_regex is None:
+        return gitignore.match_file(path)
+
+    return gitignore_regex.search(normalize_file(path)) is not None
+
+
+def is_ignored_path(path: str, gitignore=None) -> bool:
+    """Check if a relative path matches the ignore patterns or the `.gitignore` rules."""
+    if IGNORE_PATTERNS_RE.match(os.path.normcase(path)):
+        return True
+
+    return bool(gitignore and matches_gitignore(path, gitignore))
+
+
 def filter_path(
     path: str, allowed_extensions: Optional[list[str]] = None
 ) -> Optional[str]:
@@ -82,16 +151,13 @@ def filter_path(
     if not allowed_extensions:
         allowed_extensions = [".ts", ".tsx", ".js", ".jsx"]
 
-    if not any(path.endswith(ext) for ext in allowed_extensions):
+    if not path.endswith(tuple(allowed_extensions)):
         return None
 
     if os.path.isdir(path):
         return None
 
-    if any(fnmatch.fnmatch(path, pattern) for pattern in IGNORE_PATTERNS):
-        return None
-
-    if gitignore and gitignore.match_file(path):
+    if is_ignored_path(path=path, gitignore=gitignore):
         return None
 
     if path == GITIGNORE_PATH:
@@ -1,6 +1,7 @@
 import os
 import subprocess
 from collections import defaultdict
+from functools import lru_cache
 
 import pathspec
 from loguru import logger
@@ -37,22 +38,25 @@ def run_git_command(
             subprocess.run(GitCommand.RESET, check=True)
 
 
+@lru_cache(maxsize=8)
+def _load_gitignore(gitignore_path: str, mtime_ns: int, size: int):
+    """Parse a `.gitignore` file, memoized on its path, modification time and size."""
+    with open(gitignore_path, encoding="utf-8") as f:
+        return pathspec.PathSpec.from_lines(
+            pathspec.patterns.GitWildMatchPattern, f.readlines()
+        )
+
+
 def get_gitignore(dir_path: str = WORKING_DIR):
     """Get the `.gitignore` rules for a directory."""
-    try:
-        gitignore_path = os.path.join(dir_path, ".gitignore")
+    gitignore_path = os.path.join(dir_path, ".gitignore")
 
-        if os.path.exists(gitignore_path):
-            with open(gitignore_path, encoding="utf-8") as f:
-                gitignore = pathspec.PathSpec.from_lines(
-                    pathspec.patterns.GitWildMatchPattern, f.readlines()
-                )
-        else:
-            gitignore = None
-    except ImportError:
-        gitignore = None
+    try:
+        stat = os.stat(gitignore_path)
+    except OSError:
+        return None
 
-    return gitignore
+    return _load_gitignore(gitignore_path, stat.st_mtime_ns, stat.st_size)
 
 
 def parse_diff_status(diff_status: str):
@@ -8,6 +8,24 @@ from loguru import logger
 
 from bugster.analyzer.core.framework_detector.main import get_project_info
 from bugster.constants import BUGSTER_DIR
+from bugster.utils import json_io
+
+LINE_COMMENT_RE = re.compile(r"//.*$", re.MULTILINE)
+BLOCK_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+# Match various import patterns
+IMPORT_PATTERNS = (
+    # import ... from '...'
+    re.compile(r'import\s+(?:.*?\s+from\s+)?[\'"]([^\'"]+)[\'"]', re.MULTILINE),
+    # require('...')
+    re.compile(r'require\s*\(\s*[\'"]([^\'"]+)[\'"]\s*\)', re.MULTILINE),
+    # dynamic import()
+    re.compile(r'import\s*\(\s*[\'"]([^\'"]+)[\'"]\s*\)', re.MULTILINE),
+    # Next.js dynamic imports
+    re.compile(
+        r'dynamic\s*\(\s*\(\s*\)\s*=>\s*import\s*\(\s*[\'"]([^\'"]+)[\'"]\s*\)',
+        re.MULTILINE,
+    ),
+)
 
 
 class ImportTreeGenerator:
@@ -50,24 +68,11 @@ class ImportTreeGenerator:
                 content = file.read()
 
             # Remove comments to avoid false positives
-            content = re.sub(r"//.*$", "", content, flags=re.MULTILINE)
-            content = re.sub(r"/\*.*?\*/", "", content, flags=re.DOTALL)
-
-            # Match various import patterns
-            import_patterns = [
-                # import ... from '...'
-                r'import\s+(?:.*?\s+from\s+)?[\'"]([^\'"]+)[\'"]',
-                # require('...')
-                r'require\s*\(\s*[\'"]([^\'"]+)[\'"]\s*\)',
-                # dynamic import()
-                r'import\s*\(\s*[\'"]([^\'"]+)[\'"]\s*\)',
-                # Next.js dynamic imports
-                r'dynamic\s*\(\s*\(\s*\)\s*=>\s*import\s*\(\s*[\'"]([^\'"]+)[\'"]\s*\)',
-            ]
-
-            for pattern in import_patterns:
-                matches = re.findall(pattern, content, re.MULTILINE)
-                imports.extend(matches)
+            content = LINE_COMMENT_RE.sub("", content)
+            content = BLOCK_COMMENT_RE.sub("", content)
+
+            for pattern in IMPORT_PATTERNS:
+                imports.extend(pattern.findall(content))
 
         except Exception as e:
             logger.error("Error reading {}: {}", filepath, e)
@@ -394,8 +399,8 @@ class ImportTreeGenerator:
 
     def save_to_json(self, tree: Dict, filename: str = "import_tree.json"):
         """Save the import tree to a JSON file."""
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(tree, f, indent=2, ensure_ascii=False)
+        with open(filename, "wb") as f:
+            json_io.dump(tree, f)
 
         logger.info("Import tree saved to {}", filename)
 
@@ -1,18 +1,20 @@
 """File utility functions for Bugster."""
 
+import contextlib
 import json
+import os
 import tempfile
 import uuid
 from pathlib import Path
 from typing import List, Optional
 
 import typer
-import yaml
 from loguru import logger
 from rich.console import Console
 
 from bugster.constants import CONFIG_PATH, TESTS_DIR
 from bugster.types import Config
+from bugster.utils.yaml_io import safe_load
 from bugster.utils.yaml_spec import load_spec
 
 console = Console()
@@ -27,7 +29,29 @@ def load_config() -> Config:
         raise typer.Exit(1)
 
     with open(CONFIG_PATH, encoding="utf-8") as f:
-        return Config(**yaml.safe_load(f))
+        return Config(**safe_load(f))
+
+
+def write_file_atomic(path: Path, content: str, mode: int = 0o644) -> None:
+    """Write text to a file atomically.
+
+    The UTF-8 encoded content is written in a single call to a temporary file next to `path`, which then replaces
+    `path`, so readers never observe a partially written file. `mode` sets the permissions of the written file.
+    """
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+
+    try:
+        os.fchmod(fd, mode)
+
+        with os.fdopen(fd, "wb") as f:
+            f.write(content.encode("utf-8"))
+
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
 
 
 def load_test_files(test_path: Optional[Path] = None) -> List[dict]:
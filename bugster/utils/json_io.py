@@ -0,0 +1,63 @@
+"""
+JSON helpers backed by orjson (and ijson for streaming) when they are installed.
+"""
+
+import json
+from typing import Any, BinaryIO, Iterable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Documents larger than this are stream-parsed when only one member is needed
+STREAM_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+
+def loads(data):
+    """Deserialize a JSON document from `str` or `bytes`."""
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
+def dump(obj: Any, file: BinaryIO) -> None:
+    """Serialize `obj` as indented JSON to the binary `file`, encoding dataclasses as their fields."""
+    if orjson is not None:
+        file.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        return
+
+    file.write(
+        json.dumps(obj, indent=2, ensure_ascii=False, default=vars).encode("utf-8")
+    )
+
+
+def load_members(file: BinaryIO, keys: Iterable[str], size: int = 0) -> dict:
+    """Load the given top-level members of the JSON object in `file`.
+
+    Large documents are stream-parsed with ijson when available, so the raw document is never held in memory.
+    """
+    keys = set(keys)
+
+    if ijson is not None and size > STREAM_THRESHOLD_BYTES:
+        members = {
+            key: value
+            for key, value in ijson.kvitems(file, "", use_float=True)
+            if key in keys
+        }
+    else:
+        document = loads(file.read())
+        members = {key: document[key] for key in keys if key in document}
+
+    missing_keys = keys.difference(members)
+
+    if missing_keys:
+        raise KeyError(", ".join(sorted(missing_keys)))
+
+    return members
@@ -0,0 +1,29 @@
+"""
+YAML load/dump helpers backed by the LibYAML C bindings when available.
+"""
+
+from collections import OrderedDict
+from functools import partial
+
+import yaml
+from loguru import logger
+
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+if not yaml.__with_libyaml__:
+    logger.debug("LibYAML bindings not available, using pure-Python YAML")
+
+
+def _ordered_dict_representer(dumper: yaml.SafeDumper, data: OrderedDict):
+    """Custom representer for OrderedDict to maintain field order in YAML."""
+    return dumper.represent_mapping("tag:yaml.org,2002:map", data.items())
+
+
+yaml.add_representer(OrderedDict, _ordered_dict_representer, Dumper=SafeDumper)
+
+safe_dump = partial(yaml.dump, Dumper=SafeDumper)
+safe_load = partial(yaml.load, Loader=SafeLoader)
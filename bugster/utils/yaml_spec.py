@@ -12,6 +12,8 @@ from typing import Any, List, Optional
 import yaml
 from loguru import logger
 
+from bugster.utils.yaml_io import safe_dump, safe_load
+
 
 @dataclass
 class TestCaseMetadata:
@@ -61,7 +63,7 @@ class YamlTestcase:
         """Convert spec to YAML string with metadata comment"""
         # Ensure data is wrapped in a list if it's a dict
         yaml_data = [self.data] if isinstance(self.data, dict) else self.data
-        yaml_str = yaml.dump(yaml_data, sort_keys=False)
+        yaml_str = safe_dump(yaml_data, sort_keys=False)
         return f"{self.metadata.to_comment()}\n{yaml_str}"
 
 
@@ -78,7 +80,7 @@ def parse_yaml_with_testcases(content: str) -> List[YamlTestcase]:
             # If we have accumulated lines, process them as a test case
             if current_lines:
                 try:
-                    test_case_data = yaml.safe_load("\n".join(current_lines))
+                    test_case_data = safe_load("\n".join(current_lines))
                     if test_case_data:
                         test_cases.append(
                             YamlTestcase(test_case_data, current_metadata)
@@ -94,7 +96,7 @@ def parse_yaml_with_testcases(content: str) -> List[YamlTestcase]:
         # Empty line could be a separator between test cases
         elif not line.strip() and current_lines:
             try:
-                test_case_data = yaml.safe_load("\n".join(current_lines))
+                test_case_data = safe_load("\n".join(current_lines))
                 if test_case_data:
                     test_cases.append(YamlTestcase(test_case_data, current_metadata))
                 current_lines = []
@@ -105,7 +107,7 @@ def parse_yaml_with_testcases(content: str) -> List[YamlTestcase]:
     # Process any remaining lines
     if current_lines:
         try:
-            test_case_data = yaml.safe_load("\n".join(current_lines))
+            test_case_data = safe_load("\n".join(current_lines))
             if test_case_data:
                 test_cases.append(YamlTestcase(test_case_data, current_metadata))
         except yaml.YAMLError as e:
@@ -0,0 +1,229 @@
+"""
+Tests for the Next.js analyzer.
+"""
+
+import pytest
+
+from bugster.analyzer.core.app_analyzer import AppAnalyzer, nextjs_analyzer
+from bugster.analyzer.core.app_analyzer.utils import get_tree_structure
+from bugster.libs.utils import git
+from bugster.utils import json_io
+
+ROOT_LAYOUT = "export default function RootLayout({ children }) { return <html>{children}</html>; }\n"
+APP_ROUTE_HANDLER = "export async function GET() { return Response.json([]); }\n"
+PAGES_API_HANDLER = (
+    "export default function handler(req, res) {\n"
+    "  if (req.method === 'POST') { res.status(201).end(); }\n"
+    "}\n"
+)
+
+
+def write_files(root, files):
+    for path, content in files.items():
+        file_path = root / path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(content, encoding="utf-8")
+
+
+@pytest.fixture
+def app_dir(tmp_path, monkeypatch):
+    """Create an empty Next.js application directory."""
+    app_dir = tmp_path / "app-dir"
+    app_dir.mkdir()
+    get_gitignore = git.get_gitignore
+    monkeypatch.setattr(
+        git, "get_gitignore", lambda dir_path=str(app_dir): get_gitignore(dir_path)
+    )
+    monkeypatch.setattr(get_tree_structure, "_source_paths_cache", {})
+    monkeypatch.setattr(nextjs_analyzer, "get_git_info", lambda: {})
+    monkeypatch.setattr(nextjs_analyzer, "BUGSTER_DIR", str(tmp_path / ".bugster"))
+    return app_dir
+
+
+def analyze(app_dir, force=False):
+    analyzer = AppAnalyzer(
+        framework_info={"id": "next", "name": "Next.js", "dir_path": str(app_dir)}
+    )
+    return analyzer.execute(options={"force": force})
+
+
+@pytest.fixture
+def read_paths(monkeypatch):
+    """Record the paths of the source files read by the analyzer."""
+    read_paths = []
+    read_file_content = nextjs_analyzer.read_file_content
+
+    def record_read(file_path):
+        read_paths.append(file_path)
+        return read_file_content(file_path)
+
+    monkeypatch.setattr(nextjs_analyzer, "read_file_content", record_read)
+    return read_paths
+
+
+def test_api_routes_are_recorded_once(app_dir):
+    """Test that App Router and Pages Router API routes are each recorded once, and not as pages"""
+    write_files(
+        app_dir,
+        {
+            "app/layout.tsx": ROOT_LAYOUT,
+            "app/page.tsx": "export default function Home() { return <Main />; }\n",
+            "app/api/users/route.ts": APP_ROUTE_HANDLER,
+            "app/api/users/[id]/route.ts": APP_ROUTE_HANDLER,
+            "pages/api/hello.ts": PAGES_API_HANDLER,
+            "src/pages/api/legacy.ts": PAGES_API_HANDLER,
+        },
+    )
+
+    analysis = analyze(app_dir)
+
+    assert sorted(
+        (api["relativeFilePath"], api["routePath"], api["methods"])
+        for api in analysis.api_routes
+    ) == [
+        ("app/api/users/[id]/route.ts", "/api/users/:id", ["GET"]),
+        ("app/api/users/route.ts", "/api/users", ["GET"]),
+        ("pages/api/hello.ts", "/api/hello", ["POST"]),
+        ("src/pages/api/legacy.ts", "src/pages/api/legacy", ["POST"]),
+    ]
+    assert [route["relativeFilePath"] for route in analysis.routes] == ["app/page.tsx"]
+    assert analysis.stats["apiRouteCount"] == 4
+    assert analysis.stats["routeCount"] == 1
+
+
+def test_saved_analysis_is_reused_while_sources_are_unchanged(app_dir, read_paths):
+    """Test that an unchanged application is not analyzed again, unless forced"""
+    write_files(
+        app_dir,
+        {
+            "app/layout.tsx": ROOT_LAYOUT,
+            "app/page.tsx": "export default function Home() { return <Main />; }\n",
+        },
+    )
+    analysis = analyze(app_dir)
+    read_paths.clear()
+
+    assert analyze(app_dir) == analysis
+    assert read_paths == []
+
+    assert analyze(app_dir, force=True) == analysis
+    assert len(read_paths) == 2
+
+
+def test_saved_analysis_is_parsed_once_while_unchanged(app_dir, monkeypatch):
+    """Test that the saved analysis file is parsed again only after it changes"""
+    loaded_paths = []
+    load_members = json_io.load_members
+
+    def record_load(file, keys, size=0):
+        loaded_paths.append(file.name)
+        return load_members(file, keys, size=size)
+
+    monkeypatch.setattr(json_io, "load_members", record_load)
+    write_files(
+        app_dir,
+        {
+            "app/layout.tsx": ROOT_LAYOUT,
+            "app/page.tsx": "export default function Home() { return <Main />; }\n",
+        },
+    )
+    analysis = analyze(app_dir)
+
+    assert analyze(app_dir) == analysis
+    assert analyze(app_dir) == analysis
+    assert len(loaded_paths) == 1
+
+
+def test_saved_analysis_is_invalidated_by_source_changes(app_dir, read_paths):
+    """Test that a changed source file triggers a new analysis"""
+    write_files(
+        app_dir,
+        {
+            "app/layout.tsx": ROOT_LAYOUT,
+            "app/page.tsx": "export default function Home() { return <Main />; }\n",
+        },
+    )
+    analyze(app_dir)
+    write_files(
+        app_dir,
+        {"app/page.tsx": "export default function Home() { return <Landing />; }\n"},
+    )
+
+    analysis = analyze(app_dir)
+
+    assert analysis.routes[0]["components"] == ["Landing"]
+
+
+def test_analyze_contents_shares_results_of_identical_contents():
+    """Test that identical contents are analyzed once, keeping the results in order"""
+    analyzed_contents = []
+
+    def record_analysis(content):
+        analyzed_contents.append(content)
+        return nextjs_analyzer.analyze_content(content)
+
+    page = "import { Button } from 'ui';\nexport default function Page() { return <Button />; }\n"
+    route = "export { GET } from '../handlers';\n"
+
+    results = nextjs_analyzer.analyze_contents(
+        [page, route, page], analyze=record_analysis
+    )
+
+    assert analyzed_contents == [page, route]
+    assert results[0] is results[2]
+    assert results[0]["components"] == ["Button"]
+    assert results[1] == nextjs_analyzer.analyze_content(route)
+
+
+def test_files_matching_both_routers_are_processed_once(app_dir):
+    """Test that a file matching both the App Router and the Pages Router is recorded once"""
+    write_files(
+        app_dir,
+        {
+            "app/layout.tsx": ROOT_LAYOUT,
+            "app/pages/team/page.tsx": "export default function Team() { return <Members />; }\n",
+            "src/app/pages/about/page.tsx": "export default function About() { return <Story />; }\n",
+            "src/pages/blog/page.tsx": "export default function Blog() { return <Posts />; }\n",
+        },
+    )
+
+    analysis = analyze(app_dir)
+
+    assert sorted(
+        (route["relativeFilePath"], route["routePath"], route["components"])
+        for route in analysis.routes
+    ) == [
+        ("app/pages/team/page.tsx", "/pages/team", ["Members"]),
+        ("src/app/pages/about/page.tsx", "src/app/pages/about", ["Story"]),
+        ("src/pages/blog/page.tsx", "src/pages/blog/page", ["Posts"]),
+    ]
+
+
+def test_api_routes_only_extract_imports(app_dir):
+    """Test that only the imports of API routes are extracted, pages get the full analysis"""
+    write_files(
+        app_dir,
+        {
+            "app/layout.tsx": ROOT_LAYOUT,
+            "app/page.tsx": "export default function Home() { return <Main />; }\n",
+            "app/api/users/route.ts": "import { db } from '@/lib/db';\n"
+            + APP_ROUTE_HANDLER,
+        },
+    )
+    analyzer = nextjs_analyzer.NextjsAnalyzer(
+        framework_info={"id": "next", "name": "Next.js", "dir_path": str(app_dir)}
+    )
+
+    analysis = analyzer.execute()
+
+    assert analyzer.content_analysis_by_path["app/api/users/route.ts"] == {
+        "imports": ["db"]
+    }
+    assert set(analyzer.content_analysis_by_path["app/page.tsx"]) == {
+        "imports",
+        "exports",
+        "hooks",
+        "eventHandlers",
+        "components",
+    }
+    assert analysis.api_routes[0]["deps"] == ["db"]
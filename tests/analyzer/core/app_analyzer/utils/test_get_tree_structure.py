@@ -0,0 +1,171 @@
+"""
+Tests for the source tree listing.
+"""
+
+import os
+
+import pytest
+
+from bugster.analyzer.core.app_analyzer.utils import get_tree_structure
+from bugster.analyzer.core.app_analyzer.utils.get_tree_structure import (
+    build_tree_from_paths,
+    get_paths,
+)
+from bugster.libs.utils import git
+
+SOURCE_EXTENSIONS = [".ts", ".tsx", ".js", ".jsx", ".mjs", ".cjs"]
+
+
+def write_files(root, paths):
+    for path in paths:
+        file_path = root / path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text("export default null;\n", encoding="utf-8")
+
+
+@pytest.fixture
+def project_dir(tmp_path, monkeypatch):
+    """Create a project directory whose `.gitignore` rules are used by `get_paths`."""
+    get_gitignore = git.get_gitignore
+    monkeypatch.setattr(
+        git, "get_gitignore", lambda dir_path=str(tmp_path): get_gitignore(dir_path)
+    )
+    monkeypatch.setattr(get_tree_structure, "_source_paths_cache", {})
+    write_files(
+        tmp_path,
+        [
+            "src/app/page.tsx",
+            "src/app/layout.jsx",
+            "src/app/page.test.tsx",
+            "src/components/button.spec.js",
+            "src/lib.js/index.js",
+            "src/utils/config.mjs",
+            "src/README.md",
+            "node_modules/react/index.js",
+            "packages/ui/button.tsx",
+            "src/packages/ui/button.tsx",
+            "tests/app.ts",
+            ".next/server/page.js",
+            ".hidden/secret.ts",
+            "src/.eslintrc.js",
+            "generated/api.ts",
+            "generated/keep.ts",
+            "src/schema.gen.ts",
+        ],
+    )
+    return tmp_path
+
+
+def test_get_paths_excludes_ignored_paths(project_dir):
+    """Test that ignored directories, test files, hidden entries and other extensions are excluded"""
+    assert get_paths(str(project_dir)) == [
+        "generated/api.ts",
+        "generated/keep.ts",
+        "src/app/layout.jsx",
+        "src/app/page.tsx",
+        "src/lib.js/index.js",
+        "src/packages/ui/button.tsx",
+        "src/schema.gen.ts",
+    ]
+
+
+def test_get_paths_allowed_extensions(project_dir):
+    """Test listing other extensions than the default ones"""
+    assert get_paths(str(project_dir), allowed_extensions=[".mjs", ".md"]) == [
+        "src/README.md",
+        "src/utils/config.mjs",
+    ]
+
+
+def test_get_paths_gitignore(project_dir):
+    """Test that gitignored directories and files are excluded"""
+    (project_dir / ".gitignore").write_text(
+        "# Generated\ngenerated/\n*.gen.ts\n", encoding="utf-8"
+    )
+
+    assert get_paths(str(project_dir), allowed_extensions=SOURCE_EXTENSIONS) == [
+        "src/app/layout.jsx",
+        "src/app/page.tsx",
+        "src/lib.js/index.js",
+        "src/packages/ui/button.tsx",
+        "src/utils/config.mjs",
+    ]
+
+
+def test_get_paths_gitignore_negated_rule(project_dir):
+    """Test that a negated rule re-includes a file below a gitignored directory"""
+    (project_dir / ".gitignore").write_text(
+        "generated/\n!generated/keep.ts\n*.gen.ts\n", encoding="utf-8"
+    )
+
+    assert get_paths(str(project_dir)) == [
+        "generated/keep.ts",
+        "src/app/layout.jsx",
+        "src/app/page.tsx",
+        "src/lib.js/index.js",
+        "src/packages/ui/button.tsx",
+    ]
+
+
+def test_get_paths_symlinks(project_dir):
+    """Test that symlinks to files are listed and broken symlinks are skipped"""
+    os.symlink(project_dir / "src" / "app" / "page.tsx", project_dir / "src/link.tsx")
+    os.symlink(project_dir / "src" / "missing.ts", project_dir / "src/broken.ts")
+
+    paths = get_paths(str(project_dir / "src"))
+
+    assert "link.tsx" in paths
+    assert "broken.ts" not in paths
+
+
+def test_get_paths_subdirectory(project_dir):
+    """Test that the paths are relative to the listed directory"""
+    assert get_paths(str(project_dir / "src" / "lib.js")) == ["index.js"]
+
+
+def test_build_tree_from_paths():
+    """Test building the tree of a directory from its sorted file paths"""
+    tree = build_tree_from_paths(
+        root_name="src", paths=["a/b/c.ts", "a/b-x.ts", "a/d.tsx", "e.js"]
+    )
+
+    assert tree == {
+        "path": "",
+        "name": "src",
+        "type": "directory",
+        "children": [
+            {
+                "path": "a",
+                "name": "a",
+                "type": "directory",
+                "children": [
+                    {
+                        "path": "a/b",
+                        "name": "b",
+                        "type": "directory",
+                        "children": [
+                            {
+                                "path": "a/b/c.ts",
+                                "name": "c.ts",
+                                "type": "file",
+                                "extension": ".ts",
+                            }
+                        ],
+                    },
+                    {
+                        "path": "a/b-x.ts",
+                        "name": "b-x.ts",
+                        "type": "file",
+                        "extension": ".ts",
+                    },
+                    {
+                        "path": "a/d.tsx",
+                        "name": "d.tsx",
+                        "type": "file",
+                        "extension": ".tsx",
+                    },
+                ],
+            },
+            {"path": "e.js", "name": "e.js", "type": "file", "extension": ".js"},
+        ],
+    }
@@ -0,0 +1,86 @@
+"""
+Tests for TestCasesService spec saving.
+"""
+
+import os
+
+import pytest
+
+from bugster.libs.services import test_cases_service
+from bugster.libs.utils import files
+from bugster.utils.yaml_io import safe_load
+
+
+@pytest.fixture
+def tests_dir(tmp_path, monkeypatch):
+    """Point the specs directory to a temporary one."""
+    tests_dir = tmp_path / ".bugster" / "tests"
+    tests_dir.mkdir(parents=True)
+    monkeypatch.setattr(test_cases_service, "TESTS_DIR", tests_dir)
+    monkeypatch.setattr(files, "TESTS_DIR", tests_dir)
+    return tests_dir
+
+
+def make_test_case(name, page_path):
+    return {
+        "name": name,
+        "page": name,
+        "page_path": page_path,
+        "task": f"Check {name}",
+        "steps": ["Open the page"],
+        "expected_result": "The page is shown",
+    }
+
+
+def test_save_test_cases_indexes_each_folder_consecutively(tests_dir):
+    """Test that specs sharing a folder get consecutive indexes after the existing ones"""
+    (tests_dir / "dashboard").mkdir()
+    (tests_dir / "dashboard" / "3_existing.yaml").write_text("[]", encoding="utf-8")
+    test_cases = [
+        make_test_case("Dashboard A", "app/dashboard/page.tsx"),
+        make_test_case("Settings", "app/settings/page.tsx"),
+        make_test_case("Dashboard B", "app/dashboard/stats/page.tsx"),
+    ]
+
+    file_paths = test_cases_service.TestCasesService()._save_test_cases_as_yaml(
+        test_cases=test_cases
+    )
+
+    assert file_paths == [
+        os.path.join(tests_dir, "dashboard", "4_dashboard_a.yaml"),
+        os.path.join(tests_dir, "settings", "1_settings.yaml"),
+        os.path.join(tests_dir, "dashboard", "5_dashboard_b.yaml"),
+    ]
+
+    for file_path, test_case in zip(file_paths, test_cases, strict=True):
+        with open(file_path, encoding="utf-8") as f:
+            assert safe_load(f) == test_case
+
+
+def test_save_test_cases_orders_fields(tests_dir):
+    """Test that saved specs list the known fields first, then the other ones"""
+    test_case = {
+        "extra": "value",
+        "steps": ["Open the page"],
+        "name": "Home",
+        "page_path": "app/home/page.tsx",
+    }
+
+    [file_path] = test_cases_service.TestCasesService()._save_test_cases_as_yaml(
+        test_cases=[test_case]
+    )
+
+    with open(file_path, encoding="utf-8") as f:
+        assert list(safe_load(f)) == ["name", "page_path", "steps", "extra"]
+
+
+def test_get_next_spec_index_empty_folder(tests_dir):
+    """Test that the first spec of a folder gets index 1"""
+    folder_path = test_cases_service.get_or_create_folder(folder_name="home")
+
+    assert (
+        test_cases_service.TestCasesService()._get_next_spec_index(
+            folder_name="home", folder_path=folder_path
+        )
+        == 1
+    )
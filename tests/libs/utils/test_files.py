@@ -0,0 +1,140 @@
+"""
+Tests for the path ignore rules.
+"""
+
+import random
+
+import pathspec
+import pytest
+
+from bugster.libs.utils.files import (
+    get_gitignore_regex,
+    is_ignored_path,
+    matches_gitignore,
+)
+
+# pathspec 1.x deprecates the `gitwildmatch` patterns the `.gitignore` rules are parsed with
+pytestmark = pytest.mark.filterwarnings("ignore:GitWildMatchPattern:DeprecationWarning")
+
+GITIGNORE_PATTERN_PARTS = [
+    "a",
+    "build",
+    "node_modules",
+    "*.log",
+    "*",
+    "**",
+    "a?",
+    "[ab]c",
+    "(g)",
+    "c.js",
+]
+PATH_PARTS = [
+    "a",
+    "b",
+    "ac",
+    "a1",
+    "build",
+    "node_modules",
+    "x.log",
+    "(g)",
+    "c.js",
+    "page.tsx",
+]
+
+
+def make_gitignore(lines):
+    return pathspec.PathSpec.from_lines(pathspec.patterns.GitWildMatchPattern, lines)
+
+
+def make_random_gitignore_lines(rng):
+    lines = []
+
+    for _ in range(rng.randint(0, 8)):
+        line = "/".join(
+            rng.choice(GITIGNORE_PATTERN_PARTS) for _ in range(rng.randint(1, 3))
+        )
+
+        if rng.random() < 0.2:
+            line = f"/{line}"
+
+        if rng.random() < 0.2:
+            line = f"{line}/"
+
+        lines.append(line)
+
+    if rng.random() < 0.2:
+        lines.append("# Comment")
+
+    return lines
+
+
+def make_random_path(rng):
+    path = "/".join(rng.choice(PATH_PARTS) for _ in range(rng.randint(1, 4)))
+
+    if rng.random() < 0.2:
+        path = f"{path}/"
+
+    if rng.random() < 0.1:
+        path = f"./{path}"
+
+    return path
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("node_modules/react/index.js", True),
+        ("src/node_modules/react/index.js", True),
+        ("build/page.js", True),
+        ("src/build/page.js", False),
+        ("logs/error.log", True),
+        ("src/app/page.tsx", False),
+        ("generated/", True),
+        ("./generated/api.ts", True),
+    ],
+)
+def test_matches_gitignore(path, expected):
+    """Test matching paths against `.gitignore` rules without negations"""
+    gitignore = make_gitignore(
+        ["# Dependencies", "node_modules/", "/build", "*.log", "", "generated/"]
+    )
+
+    assert get_gitignore_regex(gitignore) is not None
+    assert matches_gitignore(path, gitignore) is expected
+
+
+def test_matches_gitignore_negated_rules():
+    """Test that `.gitignore` rules with negations are matched in order by pathspec"""
+    gitignore = make_gitignore(["*.log", "!keep.log", "logs/keep.log"])
+
+    assert get_gitignore_regex(gitignore) is None
+    assert matches_gitignore("error.log", gitignore)
+    assert not matches_gitignore("keep.log", gitignore)
+    assert matches_gitignore("logs/keep.log", gitignore)
+
+
+def test_gitignore_regex_matches_like_pathspec():
+    """Test that the combined `.gitignore` regex matches the same paths as pathspec"""
+    rng = random.Random(0)
+
+    for _ in range(200):
+        gitignore = make_gitignore(make_random_gitignore_lines(rng))
+
+        for _ in range(50):
+            path = make_random_path(rng)
+
+            assert matches_gitignore(path, gitignore) == gitignore.match_file(path), (
+                [pattern.pattern for pattern in gitignore.patterns],
+                path,
+            )
+
+
+def test_is_ignored_path():
+    """Test that paths are ignored by the ignore patterns or the `.gitignore` rules"""
+    gitignore = make_gitignore(["*.gen.ts"])
+
+    assert is_ignored_path("src/app/page.test.tsx")
+    assert is_ignored_path("node_modules/react/index.js")
+    assert is_ignored_path("src/schema.gen.ts", gitignore=gitignore)
+    assert not is_ignored_path("src/schema.gen.ts")
+    assert not is_ignored_path("src/app/page.tsx", gitignore=gitignore)
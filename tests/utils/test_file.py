@@ -0,0 +1,77 @@
+"""
+Tests for file utilities.
+"""
+
+import os
+import stat
+
+import pytest
+
+from bugster.utils.file import write_file_atomic
+
+
+def test_write_file_atomic_creates_file(tmp_path):
+    """Test writing a new file with the requested permissions"""
+    path = tmp_path / "config.yaml"
+
+    write_file_atomic(path, "project_name: test\n", mode=0o600)
+
+    assert path.read_bytes() == b"project_name: test\n"
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert os.listdir(tmp_path) == ["config.yaml"]
+
+
+def test_write_file_atomic_replaces_file(tmp_path):
+    """Test that an existing file is replaced and no temporary file is left"""
+    path = tmp_path / "config.yaml"
+    path.write_text("old: value\n", encoding="utf-8")
+
+    write_file_atomic(path, "new: välue\n")
+
+    assert path.read_text(encoding="utf-8") == "new: välue\n"
+    assert os.listdir(tmp_path) == ["config.yaml"]
+
+
+def test_write_file_atomic_cleans_up_on_error(tmp_path, monkeypatch):
+    """Test that a failed write removes the temporary file and keeps the original one"""
+    path = tmp_path / "config.yaml"
+    path.write_text("old: value\n", encoding="utf-8")
+
+    def fail_replace(src, dst):
+        raise OSError("replace failed")
+
+    monkeypatch.setattr(os, "replace", fail_replace)
+
+    with pytest.raises(OSError, match="replace failed"):
+        write_file_atomic(path, "new: value\n")
+
+    assert path.read_text(encoding="utf-8") == "old: value\n"
+    assert os.listdir(tmp_path) == ["config.yaml"]
+
+
+
+def test_write_file_atomic_ignores_stale_temporary_file(tmp_path):
+    """Test that a leftover temporary file does not loosen the permissions of the written file"""
+    path = tmp_path / "config.yaml"
+    stale_path = tmp_path / ".config.yaml.tmp"
+    stale_path.write_text("stale\n", encoding="utf-8")
+    stale_path.chmod(0o644)
+
+    write_file_atomic(path, "token: secret\n", mode=0o600)
+
+    assert path.read_text(encoding="utf-8") == "token: secret\n"
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert stale_path.read_text(encoding="utf-8") == "stale\n"
+
+
+def test_write_file_atomic_does_not_follow_symlinks(tmp_path):
+    """Test that a symlink at the old temporary file name is not written through"""
+    path = tmp_path / "config.yaml"
+    target_path = tmp_path / "target.yaml"
+    target_path.write_text("target\n", encoding="utf-8")
+    (tmp_path / ".config.yaml.tmp").symlink_to(target_path)
+
+    write_file_atomic(path, "token: secret\n", mode=0o600)
+
+    assert path.read_text(encoding="utf-8") == "token: secret\n"
+    assert target_path.read_text(encoding="utf-8") == "target\n"
@@ -0,0 +1,90 @@
+"""
+Tests for the JSON helpers.
+"""
+
+import io
+from dataclasses import dataclass
+
+import pytest
+
+from bugster.utils import json_io
+
+
+@dataclass
+class Layout:
+    name: str
+    children: list
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request, monkeypatch):
+    """Run a test with orjson, when it is installed, and with the standard library fallback."""
+    if request.param == "orjson":
+        if json_io.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(json_io, "orjson", None)
+
+    monkeypatch.setattr(json_io, "ijson", None)
+    return request.param
+
+
+def test_dump(backend):
+    """Test writing indented JSON, with dataclasses encoded as their fields"""
+    file = io.BytesIO()
+
+    json_io.dump({"layouts": [Layout(name="RootLayout", children=[])], "count": 1}, file)
+
+    assert file.getvalue() == (
+        b"{\n"
+        b'  "layouts": [\n'
+        b"    {\n"
+        b'      "name": "RootLayout",\n'
+        b'      "children": []\n'
+        b"    }\n"
+        b"  ],\n"
+        b'  "count": 1\n'
+        b"}"
+    )
+
+
+@pytest.mark.parametrize("data", [b'{"a": [1, 2.5]}', '{"a": [1, 2.5]}'])
+def test_loads(backend, data):
+    """Test reading JSON from `bytes` and `str`"""
+    assert json_io.loads(data) == {"a": [1, 2.5]}
+
+
+def test_load_members(backend):
+    """Test loading some top-level members of a JSON object"""
+    file = io.BytesIO(b'{"metadata": {"version": 2}, "data": [1], "other": null}')
+
+    assert json_io.load_members(
+        file, ("metadata", "data"), size=json_io.STREAM_THRESHOLD_BYTES + 1
+    ) == {"metadata": {"version": 2}, "data": [1]}
+
+
+def test_load_members_missing_key(backend):
+    """Test that a missing member raises a `KeyError`"""
+    file = io.BytesIO(b'{"metadata": {"version": 2}}')
+
+    with pytest.raises(KeyError, match="data"):
+        json_io.load_members(file, ("metadata", "data"))
+
+
+def test_load_members_streamed(monkeypatch):
+    """Test stream-parsing the members of a large JSON object with ijson"""
+    monkeypatch.setattr(json_io, "ijson", pytest.importorskip("ijson"))
+    file = io.BytesIO(b'{"metadata": {"version": 2}, "data": [1.5], "other": null}')
+
+    assert json_io.load_members(
+        file, ("metadata", "data"), size=json_io.STREAM_THRESHOLD_BYTES + 1
+    ) == {"metadata": {"version": 2}, "data": [1.5]}
+
+
+def test_dump_non_ascii(backend):
+    """Test that non-ASCII characters are written as UTF-8 rather than escaped"""
+    file = io.BytesIO()
+
+    json_io.dump({"app/café/page.tsx": ["ü"]}, file)
+
+    assert file.getvalue() == '{\n  "app/café/page.tsx": [\n    "ü"\n  ]\n}'.encode()